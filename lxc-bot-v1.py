@@ -1,17 +1,34 @@
 import discord
 from discord.ext import commands
 import asyncio
-import subprocess
+import atexit
 import json
 from datetime import datetime
-import shlex
 import logging
+import functools
+import itertools
+import operator
+import re
 import shutil
+import signal
 import os
-from typing import Optional, List, Dict, Any
+import sys
 import threading
+import urllib.parse
+import uuid
+from typing import Optional, List, Dict, Any
 import time
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
 # Load environment variables
 DISCORD_TOKEN = os.getenv('DISCORD_TOKEN')
 MAIN_ADMIN_ID = int(os.getenv('MAIN_ADMIN_ID', '1210291131301101618'))
@@ -20,6 +37,7 @@ DEFAULT_STORAGE_POOL = os.getenv('DEFAULT_STORAGE_POOL', 'default')
 CPU_THRESHOLD = int(os.getenv('CPU_THRESHOLD', '90'))
 RAM_THRESHOLD = int(os.getenv('RAM_THRESHOLD', '90'))
 CHECK_INTERVAL = int(os.getenv('CHECK_INTERVAL', '600'))  # 10 minutes for VPS monitoring
+MONITOR_CONCURRENCY = int(os.getenv('MONITOR_CONCURRENCY', '16'))  # Parallel container probes per monitor pass
 
 # Configure logging to file and console
 logging.basicConfig(
@@ -51,11 +69,42 @@ cpu_monitor_active = True
 # Helper function to truncate text to a specific length
 def truncate_text(text, max_length=1024):
     """Truncate text to max_length characters"""
-    if not text:
-        return text
-    if len(text) <= max_length:
-        return text
-    return text[:max_length-3] + "..."
+    return text if not text or len(text) <= max_length else text[:max_length-3] + "..."
+
+# Discord limits per embed
+EMBED_MAX_FIELDS = 25
+EMBED_MAX_CHARS = 6000
+
+def iter_chunks(iterable, size):
+    """Yield (start_index, items) pages of at most size items, pulling lazily from iterable"""
+    iterator = iter(iterable)
+    start = 0
+    while chunk := list(itertools.islice(iterator, size)):
+        yield start, chunk
+        start += len(chunk)
+
+# Footer timestamp, formatted at most once per second
+_footer_ts_cache = [0, ""]
+
+def _footer_time():
+    """Return the current time formatted for embed footers"""
+    now = int(time.time())
+    if _footer_ts_cache[0] != now:
+        _footer_ts_cache[0] = now
+        _footer_ts_cache[1] = datetime.fromtimestamp(now).strftime('%Y-%m-%d %H:%M:%S')
+    return _footer_ts_cache[1]
+
+@functools.lru_cache(maxsize=4096)
+def format_iso_time(iso, fmt):
+    """Reformat a stored ISO timestamp for display, repeated log views hit the cache"""
+    return datetime.fromisoformat(iso).strftime(fmt)
+
+# Suffix for generated snapshot/clone names, the counter keeps names made within the same second apart
+_name_seq = itertools.count()
+
+def _name_stamp():
+    """Return a unique timestamp suffix for generated container and snapshot names"""
+    return f"{time.strftime('%Y%m%d-%H%M%S')}-{next(_name_seq)}"
 
 # Embed creation functions with black theme and UnixNodes branding
 def create_embed(title, description="", color=0x1a1a1a):
@@ -67,11 +116,16 @@ def create_embed(title, description="", color=0x1a1a1a):
     )
 
     embed.set_thumbnail(url="https://i.imgur.com/xSsIERx.png")
-    embed.set_footer(text=f"UnixNodes VPS Manager • {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
-                    icon_url="https://i.imgur.com/xSsIERx.png")
+    set_footer(embed)
 
     return embed
 
+def set_footer(embed):
+    """Stamp the UnixNodes footer with the current time"""
+    embed.set_footer(text=f"UnixNodes VPS Manager • {_footer_time()}",
+                    icon_url="https://i.imgur.com/xSsIERx.png")
+    return embed
+
 def add_field(embed, name, value, inline=False):
     """Add a field to an embed with proper truncation"""
     embed.add_field(
@@ -81,6 +135,16 @@ def add_field(embed, name, value, inline=False):
     )
     return embed
 
+def set_field(embed, index, name, value, inline=False):
+    """Replace the field at index, truncated like add_field"""
+    embed.set_field_at(
+        index,
+        name=truncate_text(f"▸ {name}", 256),
+        value=truncate_text(value, 1024),
+        inline=inline
+    )
+    return embed
+
 def create_success_embed(title, description=""):
     return create_embed(title, description, color=0x00ff88)
 
@@ -94,42 +158,339 @@ def create_warning_embed(title, description=""):
     return create_embed(title, description, color=0xffaa00)
 
 # Data storage functions
+VPS_DATA_FILE = 'vps_data.json'
+ADMIN_DATA_FILE = 'admin_data.json'
+WAL_FILE = 'vps_data.wal'
+WAL_COMPACT_SIZE = 1024 * 1024  # Rewrite the snapshots once the WAL grows past 1MB
+
+def _json_default(obj):
+    """Encode in-memory-only types, sets are written as lists"""
+    if isinstance(obj, set):
+        return list(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+def json_dumps(obj, indent=False):
+    """Serialize to JSON bytes, using orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(obj, default=_json_default, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(obj, default=_json_default, indent=2 if indent else None).encode()
+
+def json_loads(data):
+    """Parse JSON bytes, using orjson when available"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
 def load_vps_data():
     try:
-        with open('vps_data.json', 'r') as f:
-            return json.load(f)
+        with open(VPS_DATA_FILE, 'rb') as f:
+            return json_loads(f.read())
     except (FileNotFoundError, json.JSONDecodeError):
         logger.warning("vps_data.json not found or corrupted, initializing empty data")
         return {}
 
 def load_admin_data():
     try:
-        with open('admin_data.json', 'r') as f:
-            return json.load(f)
+        with open(ADMIN_DATA_FILE, 'rb') as f:
+            return json_loads(f.read())
     except (FileNotFoundError, json.JSONDecodeError):
         logger.warning("admin_data.json not found or corrupted, initializing with main admin")
         return {"admins": [str(MAIN_ADMIN_ID)]}
 
-# Load all data at startup
-vps_data = load_vps_data()
-admin_data = load_admin_data()
-
-# Save data function
+def apply_event(event):
+    """Apply one logged mutation to the in-memory data"""
+    if event["type"] == "user":
+        if event["vps"]:
+            vps_data[event["user_id"]] = event["vps"]
+        else:
+            vps_data.pop(event["user_id"], None)
+    elif event["type"] == "admins":
+        admin_data["admins"] = event["admins"]
+    elif event["type"] == "snapshot":
+        vps_data.clear()
+        vps_data.update(event["vps"])
+        admin_data.clear()
+        admin_data.update(event["admin"])
+
+def replay_wal():
+    """Replay mutations logged since the last snapshot, returns the number applied"""
+    applied = 0
+    try:
+        with open(WAL_FILE, 'rb') as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    apply_event(json_loads(line))
+                    applied += 1
+                except (json.JSONDecodeError, KeyError):
+                    # A torn write from a crash can only affect the last line
+                    logger.warning("Skipping corrupted WAL entry")
+    except FileNotFoundError:
+        pass
+    return applied
+
+# In-memory data, filled in by load_data() before the bot connects
+vps_data = {}
+admin_data = {"admins": []}
+
+def migrate_vps_record(vps):
+    """Bring a VPS record up to the current schema, returns True if it changed
+    Converts "4GB"-string specs to ints and adds the fields older records lack"""
+    changed = False
+    for field, default in (('suspended', False), ('suspension_history', [])):
+        if field not in vps:
+            vps[field] = default
+            changed = True
+    if isinstance(vps.get('ram'), str):
+        vps['ram'] = int(vps['ram'].replace('GB', ''))
+        vps['cpu'] = int(vps['cpu'])
+        vps['storage'] = int(vps['storage'].replace('GB', ''))
+        # Rendered on demand by config_str() now
+        vps.pop('config', None)
+        changed = True
+    return changed
+
+def fmt_gb(n):
+    """Render a GB amount stored as an int"""
+    return f"{n}GB"
+
+def config_str(vps):
+    """Human readable spec line of a VPS"""
+    return f"{fmt_gb(vps['ram'])} RAM / {vps['cpu']} CPU / {fmt_gb(vps['storage'])} Disk"
+
+def specs_str(vps):
+    """RAM / CPU / storage lines of a VPS for embed fields"""
+    return f"**RAM:** {fmt_gb(vps['ram'])}\n**CPU:** {vps['cpu']} Cores\n**Storage:** {fmt_gb(vps['storage'])}"
+
+# (status, suspended) -> label shown in listings, unknown statuses are formatted on the fly
+STATUS_LABELS = {
+    (status, suspended): status.upper() + (" (SUSPENDED)" if suspended else "")
+    for status in ('running', 'stopped', 'suspended', 'unknown')
+    for suspended in (False, True)
+}
+
+def status_label(status, suspended=False):
+    """Upper-case status of a VPS with a (SUSPENDED) suffix when suspended"""
+    label = STATUS_LABELS.get((status, bool(suspended)))
+    if label is None:
+        label = status.upper() + (" (SUSPENDED)" if suspended else "")
+    return label
+
+# container_name -> (user_id, vps), where vps is a live reference into vps_data
+container_index = {}
+
+def rebuild_container_index():
+    """Rebuild the container lookup index from vps_data"""
+    container_index.clear()
+    container_index.update({vps['container_name']: (user_id, vps) for user_id, vps_list in vps_data.items() for vps in vps_list})
+
+# Aggregate VPS counters, kept in step with every mutation so admin overviews don't rescan all VPS
+vps_totals = {"vps": 0, "running": 0, "suspended": 0, "ram_gb": 0, "cpu": 0, "storage_gb": 0}
+
+def _account(vps, sign):
+    """Add (sign=1) or remove (sign=-1) one VPS's contribution to vps_totals"""
+    vps_totals["vps"] += sign
+    if vps['suspended']:
+        vps_totals["suspended"] += sign
+    elif vps.get('status') == 'running':
+        vps_totals["running"] += sign
+    vps_totals["ram_gb"] += sign * vps['ram']
+    vps_totals["cpu"] += sign * vps['cpu']
+    vps_totals["storage_gb"] += sign * vps['storage']
+
+def update_vps(vps, **changes):
+    """Apply field changes to a tracked VPS, keeping vps_totals in step"""
+    _account(vps, -1)
+    vps.update(changes)
+    _account(vps, 1)
+
+# Oldest suspension events are dropped past this many per VPS
+SUSPENSION_HISTORY_LIMIT = 200
+
+def record_suspension(vps, reason, by):
+    """Append a suspension event to a VPS, history stays oldest-first and capped"""
+    history = vps['suspension_history']
+    history.append({
+        'time': datetime.now().isoformat(),
+        'reason': reason,
+        'by': by
+    })
+    if len(history) > SUSPENSION_HISTORY_LIMIT:
+        del history[:-SUSPENSION_HISTORY_LIMIT]
+
+def rebuild_vps_totals():
+    """Recount vps_totals from vps_data"""
+    for key in vps_totals:
+        vps_totals[key] = 0
+    for vps_list in vps_data.values():
+        for vps in vps_list:
+            _account(vps, 1)
+
+# Int ID set view of admin_data["admins"] for O(1) permission checks on author.id,
+# the list of string IDs stays the persisted form
+admin_set = set()
+
+# WAL state, file access is locked because the save worker writes from a thread
+SAVE_DELAY = 0.5  # Seconds to coalesce mutations into one write + fsync
+_wal_file = None
+_wal_size = 0
+_wal_lock = threading.Lock()
+_dirty_users = set()
+_admins_dirty = False
+_snapshot_pending = False
+# Created by main() on the running loop, on 3.9 an Event binds to whatever loop exists when it is built
+_save_event = None
+
+def _wake_save_worker():
+    """Signal the save worker, marks made before main() are picked up when the event is created"""
+    if _save_event is not None:
+        _save_event.set()
+
+def _write_file_atomically(path, data):
+    """Write data to a temp file and rename it over path, so a crash never leaves a torn file"""
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+def _snapshot_bytes():
+    """Serialize both data files plus a WAL event carrying the same full state"""
+    state = {"type": "snapshot", "vps": vps_data, "admin": admin_data}
+    return json_dumps(vps_data, indent=True), json_dumps(admin_data, indent=True), json_dumps(state) + b"\n"
+
+def _write_snapshot(vps_bytes, admin_bytes, state_bytes):
+    """Write both data files and truncate the WAL"""
+    global _wal_file, _wal_size
+    with _wal_lock:
+        # Replaying older per-user events over a newer snapshot would roll those users back, and a crash
+        # can land between the two file replaces or before the truncate. So the full state is fsynced to
+        # the WAL first: until the truncate, replay always ends on exactly what the snapshot holds.
+        if _wal_file is None:
+            _wal_file = open(WAL_FILE, 'ab')
+        _wal_file.write(state_bytes)
+        _wal_file.flush()
+        os.fsync(_wal_file.fileno())
+        _write_file_atomically(VPS_DATA_FILE, vps_bytes)
+        _write_file_atomically(ADMIN_DATA_FILE, admin_bytes)
+        _wal_file.close()
+        _wal_file = None
+        open(WAL_FILE, 'wb').close()
+        _wal_size = 0
+
+# Save data function - queues a full snapshot of both files for the save worker
 def save_data():
+    global _snapshot_pending
+    _snapshot_pending = True
+    _wake_save_worker()
+
+def flush_now():
+    """Synchronously write everything still queued, for shutdown when the save worker no longer runs"""
+    global _snapshot_pending, _admins_dirty
+    if not (_snapshot_pending or _dirty_users or _admins_dirty):
+        return
     try:
-        with open('vps_data.json', 'w') as f:
-            json.dump(vps_data, f, indent=4)
-        with open('admin_data.json', 'w') as f:
-            json.dump(admin_data, f, indent=4)
+        _write_snapshot(*_snapshot_bytes())
+        _snapshot_pending = _admins_dirty = False
+        _dirty_users.clear()
         logger.info("Data saved successfully")
     except Exception as e:
         logger.error(f"Error saving data: {e}")
 
+def _write_wal(data):
+    """Append serialized events to the WAL as one fsynced group commit"""
+    global _wal_file, _wal_size
+    with _wal_lock:
+        if _wal_file is None:
+            _wal_file = open(WAL_FILE, 'ab')
+        _wal_file.write(data)
+        _wal_file.flush()
+        os.fsync(_wal_file.fileno())
+        _wal_size = _wal_file.tell()
+
+async def flush_pending():
+    """Write queued changes, as a snapshot when one was requested or the WAL grew too large, else as WAL events"""
+    global _snapshot_pending, _admins_dirty
+    if not (_snapshot_pending or _dirty_users or _admins_dirty):
+        return
+    # Compaction is decided up front: a snapshot logs the full state to the WAL before replacing the
+    # data files, so the dirty users' events would only be a second fsync of records it already holds
+    snapshot = _snapshot_pending or _wal_size > WAL_COMPACT_SIZE
+    users, admins = set(_dirty_users), _admins_dirty
+    _snapshot_pending = _admins_dirty = False
+    _dirty_users.clear()
+    try:
+        if snapshot:
+            await asyncio.to_thread(_write_snapshot, *_snapshot_bytes())
+            logger.info("Data saved successfully")
+        else:
+            # One record per dirty user however often it changed since the last flush, serialized
+            # on the loop so handlers can't mutate the data mid-encode; only the I/O runs in a thread
+            events = [{"type": "user", "user_id": user_id, "vps": vps_data.get(user_id, [])} for user_id in users]
+            if admins:
+                events.append({"type": "admins", "admins": admin_data.get("admins", [])})
+            data = b"".join(json_dumps(event) + b"\n" for event in events)
+            await asyncio.to_thread(_write_wal, data)
+    except Exception as e:
+        logger.error(f"Error saving data: {e}")
+        _snapshot_pending = _snapshot_pending or snapshot
+        _admins_dirty = _admins_dirty or admins
+        _dirty_users.update(users)
+        _wake_save_worker()
+
+async def save_worker():
+    """Background task writing queued mutations in batches"""
+    while True:
+        await _save_event.wait()
+        await asyncio.sleep(SAVE_DELAY)
+        _save_event.clear()
+        await flush_pending()
+
+def save_users(*user_ids):
+    """Mark users whose VPS list must be persisted by the save worker"""
+    _dirty_users.update(user_ids)
+    _wake_save_worker()
+
+def save_admins():
+    """Mark the admin list to be persisted by the save worker"""
+    global _admins_dirty
+    _admins_dirty = True
+    _wake_save_worker()
+
+# Load all data at startup: snapshots first, then the WAL on top of them
+async def load_data():
+    """Load the snapshots in parallel off the event loop, replay the WAL on top and rebuild derived state"""
+    global vps_data, admin_data
+    vps_data, admin_data = await asyncio.gather(asyncio.to_thread(load_vps_data), asyncio.to_thread(load_admin_data))
+    replayed = await asyncio.to_thread(replay_wal)
+    migrated = sum(migrate_vps_record(vps) for vps_list in vps_data.values() for vps in vps_list)
+
+    # shared_with is a set in memory for O(1) access checks, json_dumps writes it back as a list
+    for vps_list in vps_data.values():
+        for vps in vps_list:
+            vps['shared_with'] = set(vps.get('shared_with', []))
+
+    rebuild_container_index()
+    rebuild_vps_totals()
+    admin_set.clear()
+    admin_set.update(int(admin_id) for admin_id in admin_data.get("admins", []))
+
+    # Fold replayed events and migrated records into fresh snapshots
+    if replayed or migrated:
+        save_data()
+    logger.info(f"Loaded {vps_totals['vps']} VPS of {len(vps_data)} users")
+
 # Admin checks - Updated to not send message in predicate, more specific errors
+def user_is_admin(user_id):
+    """True if the (int) user ID is the main admin or a UnixNodes admin"""
+    return user_id == MAIN_ADMIN_ID or user_id in admin_set
+
 def is_admin():
     async def predicate(ctx):
-        user_id = str(ctx.author.id)
-        if user_id == str(MAIN_ADMIN_ID) or user_id in admin_data.get("admins", []):
+        if user_is_admin(ctx.author.id):
             return True
         # Custom error handling moved to on_command_error for better UX
         raise commands.CheckFailure(f"You need admin permissions to use this command. Contact UnixNodes support.")
@@ -137,18 +498,18 @@ def is_admin():
 
 def is_main_admin():
     async def predicate(ctx):
-        if str(ctx.author.id) == str(MAIN_ADMIN_ID):
+        if ctx.author.id == MAIN_ADMIN_ID:
             return True
         raise commands.CheckFailure("Only the main admin can use this command.")
     return commands.check(predicate)
 
 # Clean LXC command execution
-async def execute_lxc(command, timeout=120):
-    """Execute LXC command with timeout and error handling"""
+async def execute_lxc(*args, timeout=120):
+    """Execute LXC command with timeout and error handling, args are the lxc arguments"""
+    command = " ".join(("lxc",) + args)
     try:
-        cmd = shlex.split(command)
         proc = await asyncio.create_subprocess_exec(
-            *cmd,
+            "lxc", *args,
             stdout=asyncio.subprocess.PIPE,
             stderr=asyncio.subprocess.PIPE
         )
@@ -166,6 +527,177 @@ async def execute_lxc(command, timeout=120):
         logger.error(f"LXC Error: {command} - {str(e)}")
         raise
 
+# Embeds only show the first 1000 characters of command output, no need to hold more than this
+OUTPUT_LIMIT = 2048
+
+async def run_capped(*args, limit=OUTPUT_LIMIT, timeout=10, kill_on_overflow=True):
+    """Run a command keeping at most limit bytes of stdout and stderr, returns (returncode, stdout, stderr)
+    The process is killed once it writes more than that, returncode is None when it was cut off;
+    with kill_on_overflow=False the rest is drained and discarded and the command runs to completion.
+    timeout=None waits for the command however long it takes"""
+    # Own process group, so killing it also closes the pipes held by anything it spawned
+    proc = await asyncio.create_subprocess_exec(
+        *args,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+        start_new_session=True
+    )
+    overflowed = False
+
+    def kill():
+        try:
+            os.killpg(proc.pid, signal.SIGKILL)
+        except ProcessLookupError:
+            pass
+
+    async def read(stream):
+        nonlocal overflowed
+        data = b""
+        # One byte past the limit tells a full page apart from an overflow
+        while len(data) <= limit:
+            chunk = await stream.read(limit + 1 - len(data))
+            if not chunk:
+                return data
+            data += chunk
+        if not kill_on_overflow:
+            # Keep the pipe empty so the command never blocks on a full buffer
+            while await stream.read(65536):
+                pass
+            return data[:limit]
+        # Kill right away so the other stream hits EOF too
+        overflowed = True
+        kill()
+        return data[:limit]
+
+    async def communicate():
+        output = await asyncio.gather(read(proc.stdout), read(proc.stderr))
+        await proc.wait()
+        return output
+
+    try:
+        # One deadline for reading and exiting, so a command never gets more than timeout in total
+        stdout, stderr = await asyncio.wait_for(communicate(), timeout=timeout)
+    except asyncio.TimeoutError:
+        kill()
+        await proc.wait()
+        raise Exception(f"Command timed out after {timeout} seconds")
+    returncode = None if overflowed else proc.returncode
+    return returncode, stdout.decode(errors="replace"), stderr.decode(errors="replace")
+
+# Never-started Ubuntu container that new VPS are copied from, so the image isn't unpacked per VPS
+TEMPLATE_CONTAINER = os.getenv('TEMPLATE_CONTAINER', 'unixnodes-template-ubuntu2204')
+_template_ready = False
+
+async def ensure_template():
+    """Create the template container if it is missing, provisioning falls back to the image until it exists"""
+    global _template_ready
+    try:
+        await lxd_query(instance_path(TEMPLATE_CONTAINER))
+    except Exception:
+        logger.info(f"Creating template container {TEMPLATE_CONTAINER}")
+        try:
+            await execute_lxc("init", "ubuntu:22.04", TEMPLATE_CONTAINER, "--storage", DEFAULT_STORAGE_POOL, timeout=600)
+        except Exception as e:
+            logger.error(f"Could not create template container, provisioning from the image instead: {e}")
+            return
+    _template_ready = True
+
+async def provision_container(container_name, ram_mb, cpu, disk_gb):
+    """Create a container with its limits and root disk size, then start it"""
+    # Limits and the root size go in at creation time, sparing a config round-trip per setting
+    limits = (
+        "-c", f"limits.memory={ram_mb}MB",
+        "-c", f"limits.cpu={cpu}",
+        "-d", f"root,size={disk_gb}GB"
+    )
+    if _template_ready:
+        await execute_lxc("copy", TEMPLATE_CONTAINER, container_name, "--instance-only", "--storage", DEFAULT_STORAGE_POOL, *limits)
+    else:
+        await execute_lxc("init", "ubuntu:22.04", container_name, "--storage", DEFAULT_STORAGE_POOL, *limits)
+    await execute_lxc("start", container_name)
+
+class LxcShell:
+    """Async context manager holding one bash session inside a container, so several commands share a single lxc exec"""
+    def __init__(self, container_name, timeout=120):
+        self.container_name = container_name
+        self.timeout = timeout
+        self.proc = None
+
+    async def __aenter__(self):
+        self.proc = await asyncio.create_subprocess_exec(
+            "lxc", "exec", self.container_name, "--", "bash",
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.STDOUT
+        )
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self.proc.stdin.close()
+        try:
+            await asyncio.wait_for(self.proc.wait(), timeout=5)
+        except asyncio.TimeoutError:
+            self.proc.kill()
+            await self.proc.wait()
+
+    async def run(self, command, timeout=None):
+        """Run a command in the shell and return (exit_code, output)"""
+        # The command must not read the shell's stdin, and the marker starts on a fresh line even after unterminated output
+        sentinel = f"__DONE_{uuid.uuid4().hex}__"
+        self.proc.stdin.write(f"{{ {command}\n}} < /dev/null 2>&1; printf '\\n{sentinel} %d\\n' $?\n".encode())
+        await self.proc.stdin.drain()
+
+        lines = []
+        async def read_until_sentinel():
+            while True:
+                line = await self.proc.stdout.readline()
+                if not line:
+                    raise Exception(f"Shell in {self.container_name} exited unexpectedly")
+                text = line.decode(errors='replace')
+                if text.startswith(sentinel):
+                    return int(text[len(sentinel):])
+                lines.append(text)
+
+        try:
+            code = await asyncio.wait_for(read_until_sentinel(), timeout=timeout or self.timeout)
+        except asyncio.TimeoutError:
+            raise Exception(f"Command timed out after {timeout or self.timeout} seconds")
+        return code, "".join(lines).strip()
+
+# LXD REST access over the local unix socket, avoids a fork/exec of the lxc client per query
+LXD_SOCKET = os.getenv('LXD_SOCKET') or next(
+    (path for path in ('/var/snap/lxd/common/lxd/unix.socket', '/var/lib/lxd/unix.socket') if os.path.exists(path)),
+    None
+)
+
+def instance_path(container_name, suffix=""):
+    """LXD API path of an instance, the name is percent-encoded so user input can't break the request line"""
+    return f"/1.0/instances/{urllib.parse.quote(container_name, safe='')}{suffix}"
+
+async def lxd_query(path, timeout=30):
+    """GET a LXD REST API path and return its metadata"""
+    if any(c.isspace() or not c.isprintable() for c in path):
+        raise ValueError(f"Invalid LXD API path: {path!r}")
+    if not LXD_SOCKET:
+        # No reachable socket, let the lxc client do the request
+        output = await execute_lxc("query", path, timeout=timeout)
+        return json_loads(output) if isinstance(output, str) else None
+
+    reader, writer = await asyncio.wait_for(asyncio.open_unix_connection(LXD_SOCKET), timeout=timeout)
+    try:
+        # HTTP/1.0 makes LXD close the connection after a plain, unchunked body
+        writer.write(f"GET {path} HTTP/1.0\r\nHost: lxd\r\n\r\n".encode())
+        await writer.drain()
+        response = await asyncio.wait_for(reader.read(), timeout=timeout)
+    finally:
+        writer.close()
+
+    _, _, body = response.partition(b"\r\n\r\n")
+    result = json_loads(body)
+    if result.get("type") == "error":
+        raise Exception(result.get("error") or f"LXD request failed: {path}")
+    return result.get("metadata")
+
 # Get or create VPS user role
 async def get_or_create_vps_role(guild):
     """Get or create the VPS User role"""
@@ -196,236 +728,307 @@ async def get_or_create_vps_role(guild):
         return None
 
 # Host CPU monitoring function
+def _read_cpu_jiffies():
+    """Read the aggregate CPU line of /proc/stat and return (idle, total) jiffies"""
+    with open('/proc/stat', 'r') as f:
+        fields = [int(x) for x in f.readline().split()[1:]]
+    idle = fields[3] + fields[4]  # idle + iowait
+    total = sum(fields[:8])
+    return idle, total
+
 def get_cpu_usage():
     """Get current CPU usage percentage"""
     try:
-        # Get CPU usage using top command
-        result = subprocess.run(['top', '-bn1'], capture_output=True, text=True)
-        output = result.stdout
-        
-        # Parse the output to get CPU usage
-        for line in output.split('\n'):
-            if '%Cpu(s):' in line:
-                words = line.split()
-                for i, word in enumerate(words):
-                    if word == 'id,':
-                        idle_str = words[i-1].rstrip(',')
-                        try:
-                            idle = float(idle_str)
-                            usage = 100.0 - idle
-                            return usage
-                        except ValueError:
-                            pass
-                break
-        return 0.0
+        idle1, total1 = _read_cpu_jiffies()
+        time.sleep(0.2)
+        idle2, total2 = _read_cpu_jiffies()
+        total_delta = total2 - total1
+        if total_delta <= 0:
+            return 0.0
+        return (1 - (idle2 - idle1) / total_delta) * 100
     except Exception as e:
         logger.error(f"Error getting CPU usage: {e}")
         return 0.0
 
-def cpu_monitor():
+async def cpu_monitor():
     """Monitor CPU usage and stop all VPS if threshold is exceeded"""
-    global cpu_monitor_active
-    
-    while cpu_monitor_active:
+    while True:
         try:
-            cpu_usage = get_cpu_usage()
-            logger.info(f"Current CPU usage: {cpu_usage}%")
-            
-            if cpu_usage > CPU_THRESHOLD:
-                logger.warning(f"CPU usage ({cpu_usage}%) exceeded threshold ({CPU_THRESHOLD}%). Stopping all VPS.")
-                
-                # Execute lxc stop --all --force
-                try:
-                    subprocess.run(['lxc', 'stop', '--all', '--force'], check=True)
-                    logger.info("All VPS stopped due to high CPU usage")
-                    
-                    # Update all VPS status in database
-                    for user_id, vps_list in vps_data.items():
-                        for vps in vps_list:
-                            if vps.get('status') == 'running':
-                                vps['status'] = 'stopped'
-                    save_data()
-                except Exception as e:
-                    logger.error(f"Error stopping all VPS: {e}")
-            
-            time.sleep(60)  # Check host every 60 seconds
+            if cpu_monitor_active:
+                cpu_usage = await asyncio.to_thread(get_cpu_usage)
+                logger.info(f"Current CPU usage: {cpu_usage}%")
+
+                if cpu_usage > CPU_THRESHOLD:
+                    logger.warning(f"CPU usage ({cpu_usage}%) exceeded threshold ({CPU_THRESHOLD}%). Stopping all VPS.")
+
+                    # Stop every running VPS in parallel instead of one serialized lxc stop --all
+                    try:
+                        running = [(user_id, vps) for user_id, vps in container_index.values() if vps.get('status') == 'running']
+                        results = await asyncio.gather(
+                            *(execute_lxc("stop", vps['container_name'], "--force") for _, vps in running),
+                            return_exceptions=True
+                        )
+                        stopped = 0
+                        owners = set()
+                        for (user_id, vps), result in zip(running, results):
+                            if isinstance(result, Exception):
+                                logger.error(f"Error stopping {vps['container_name']}: {result}")
+                                continue
+                            # Update VPS status in database
+                            update_vps(vps, status='stopped')
+                            invalidate_container_stats(vps['container_name'])
+                            owners.add(user_id)
+                            stopped += 1
+                        logger.info(f"Stopped {stopped}/{len(running)} VPS due to high CPU usage")
+                        save_users(*owners)
+                    except Exception as e:
+                        logger.error(f"Error stopping all VPS: {e}")
+
+            await asyncio.sleep(60)  # Check host every 60 seconds
         except Exception as e:
             logger.error(f"Error in CPU monitor: {e}")
-            time.sleep(60)
+            await asyncio.sleep(60)
 
-# Start CPU monitoring in a separate thread
-cpu_thread = threading.Thread(target=cpu_monitor, daemon=True)
-cpu_thread.start()
+# Short-lived cache for live container stats, absorbs repeated clicks on Stats / !manage
+STATS_CACHE_TTL = 5.0
+_stats_caches = []
+
+def async_ttl_cache(ttl=STATS_CACHE_TTL):
+    """Cache a per-container coroutine result for ttl seconds"""
+    def decorator(func):
+        cache = {}
+        locks = {}
+        last_sweep = time.monotonic()
+
+        def sweep(now):
+            """Forget expired entries and idle locks, so deleted containers don't pile up"""
+            for name in [name for name, entry in cache.items() if now - entry[0] >= ttl]:
+                del cache[name]
+            for name in [name for name, lock in locks.items() if name not in cache and not lock.locked()]:
+                del locks[name]
+
+        @functools.wraps(func)
+        async def wrapper(container_name):
+            nonlocal last_sweep
+            now = time.monotonic()
+            entry = cache.get(container_name)
+            if entry and now - entry[0] < ttl:
+                return entry[1]
+            # At most one sweep per ttl, on a miss
+            if now - last_sweep >= ttl:
+                last_sweep = now
+                sweep(now)
+            # Concurrent misses for the same container share one probe
+            async with locks.setdefault(container_name, asyncio.Lock()):
+                entry = cache.get(container_name)
+                if entry and time.monotonic() - entry[0] < ttl:
+                    return entry[1]
+                value = await func(container_name)
+                cache[container_name] = (time.monotonic(), value)
+                return value
+
+        def invalidate(container_name):
+            cache.pop(container_name, None)
+            lock = locks.get(container_name)
+            if lock is not None and not lock.locked():
+                del locks[container_name]
+
+        wrapper.invalidate = invalidate
+        _stats_caches.append(wrapper)
+        return wrapper
+    return decorator
+
+def invalidate_container_stats(container_name):
+    """Drop cached stats of a container after its state changed"""
+    for cached in _stats_caches:
+        cached.invalidate(container_name)
 
 # Helper functions for container stats
+@async_ttl_cache()
 async def get_container_status(container_name):
     """Get the status of the LXC container"""
     try:
-        proc = await asyncio.create_subprocess_exec(
-            "lxc", "info", container_name,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE
-        )
-        stdout, _ = await proc.communicate()
-        output = stdout.decode()
-        for line in output.splitlines():
-            if line.startswith("Status: "):
-                return line.split(": ", 1)[1].strip()
-        return "Unknown"
-    except Exception:
-        return "Unknown"
-
-async def get_container_cpu(container_name):
-    """Get CPU usage inside the container as string"""
-    usage = await get_container_cpu_pct(container_name)
-    return f"{usage:.1f}%"
-
-async def get_container_cpu_pct(container_name):
-    """Get CPU usage percentage inside the container as float"""
-    try:
-        proc = await asyncio.create_subprocess_exec(
-            "lxc", "exec", container_name, "--", "top", "-bn1",
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE
-        )
-        stdout, _ = await proc.communicate()
-        output = stdout.decode()
-        for line in output.splitlines():
-            if '%Cpu(s):' in line:
-                words = line.split()
-                for i, word in enumerate(words):
-                    if word == 'id,':
-                        idle_str = words[i-1].rstrip(',')
-                        try:
-                            idle = float(idle_str)
-                            usage = 100.0 - idle
-                            return usage
-                        except ValueError:
-                            pass
-                break
-        return 0.0
-    except Exception as e:
-        logger.error(f"Error getting CPU for {container_name}: {e}")
-        return 0.0
-
-async def get_container_memory(container_name):
-    """Get memory usage inside the container"""
-    try:
-        proc = await asyncio.create_subprocess_exec(
-            "lxc", "exec", container_name, "--", "free", "-m",
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE
-        )
-        stdout, _ = await proc.communicate()
-        lines = stdout.decode().splitlines()
-        if len(lines) > 1:
-            parts = lines[1].split()
-            total = int(parts[1])
-            used = int(parts[2])
-            usage_pct = (used / total * 100) if total > 0 else 0
-            return f"{used}/{total} MB ({usage_pct:.1f}%)"
-        return "Unknown"
+        state = await lxd_query(instance_path(container_name, "/state"))
+        return state["status"].upper()
     except Exception:
         return "Unknown"
 
-async def get_container_ram_pct(container_name):
-    """Get RAM usage percentage inside the container as float"""
+# Idle percentage in top's "%Cpu(s): ... 96.5 id," summary line, some locales print "96,5"
+CPU_IDLE_RE = re.compile(rb'^%?Cpu\(s\):[^\n]*?(?<!\d)(?<!\d[.,])(\d+(?:[.,]\d+)?)\s+id\b', re.MULTILINE)
+
+def _parse_cpu_pct(output):
+    """Parse CPU usage percentage from raw `top -bn1` output bytes"""
+    match = CPU_IDLE_RE.search(output)
+    return 100.0 - float(match.group(1).replace(b',', b'.')) if match else 0.0
+
+def _parse_memory(output):
+    """Parse (used, total) MB from `free -m` output, or None if unavailable"""
+    lines = output.splitlines()
+    if len(lines) > 1:
+        parts = lines[1].split()
+        return int(parts[2]), int(parts[1])
+    return None
+
+def _parse_disk(output):
+    """Parse root filesystem usage from `df -h /` output"""
+    for line in output.splitlines():
+        if '/dev/' in line and ' /' in line:
+            parts = line.split()
+            if len(parts) >= 5:
+                used = parts[2]
+                size = parts[1]
+                perc = parts[4]
+                return f"{used}/{size} ({perc})"
+    return "Unknown"
+
+# Single in-container script for all live stats, sections split by sentinel lines
+STATS_SCRIPT = "top -bn1 | head -5; echo '---FREE---'; free -m; echo '---DF---'; df -h /"
+
+@async_ttl_cache()
+async def get_container_stats_bulk(container_name):
+    """Get status, CPU, RAM and disk usage of the container with a single lxc exec"""
+    stats = {
+        "status": "RUNNING",
+        "cpu": 0.0,
+        "ram": 0.0,
+        "memory": "Unknown",
+        "disk": "Unknown"
+    }
     try:
         proc = await asyncio.create_subprocess_exec(
-            "lxc", "exec", container_name, "--", "free", "-m",
+            "lxc", "exec", container_name, "--", "sh", "-c", STATS_SCRIPT,
             stdout=asyncio.subprocess.PIPE,
             stderr=asyncio.subprocess.PIPE
         )
         stdout, _ = await proc.communicate()
-        lines = stdout.decode().splitlines()
-        if len(lines) > 1:
-            parts = lines[1].split()
-            total = int(parts[1])
-            used = int(parts[2])
-            usage_pct = (used / total * 100) if total > 0 else 0
-            return usage_pct
-        return 0.0
+        if proc.returncode != 0:
+            # exec only fails when the container is not running, so ask lxc for the real state
+            stats["status"] = await get_container_status(container_name)
+            return stats
+
+        top_out, _, rest = stdout.partition(b'---FREE---')
+        free_out, _, df_out = rest.partition(b'---DF---')
+        stats["cpu"] = _parse_cpu_pct(top_out)
+        memory = _parse_memory(free_out.decode().strip())
+        if memory:
+            used, total = memory
+            stats["ram"] = (used / total * 100) if total > 0 else 0
+            stats["memory"] = f"{used}/{total} MB ({stats['ram']:.1f}%)"
+        stats["disk"] = _parse_disk(df_out.decode())
     except Exception as e:
-        logger.error(f"Error getting RAM for {container_name}: {e}")
-        return 0.0
-
-async def get_container_disk(container_name):
-    """Get disk usage inside the container"""
-    try:
-        proc = await asyncio.create_subprocess_exec(
-            "lxc", "exec", container_name, "--", "df", "-h", "/",
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE
-        )
-        stdout, _ = await proc.communicate()
-        lines = stdout.decode().splitlines()
-        for line in lines:
-            if '/dev/' in line and ' /' in line:
-                parts = line.split()
-                if len(parts) >= 5:
-                    used = parts[2]
-                    size = parts[1]
-                    perc = parts[4]
-                    return f"{used}/{size} ({perc})"
-        return "Unknown"
-    except Exception:
-        return "Unknown"
+        logger.error(f"Error getting stats for {container_name}: {e}")
+        stats["status"] = "Unknown"
+    return stats
 
 def get_uptime():
     """Get host uptime"""
     try:
-        result = subprocess.run(['uptime'], capture_output=True, text=True)
-        return result.stdout.strip()
+        with open('/proc/uptime', 'r') as f:
+            seconds = int(float(f.readline().split()[0]))
+        with open('/proc/loadavg', 'r') as f:
+            load = f.readline().split()[:3]
+        days, seconds = divmod(seconds, 86400)
+        hours, seconds = divmod(seconds, 3600)
+        minutes = seconds // 60
+        up = f"{days} day{'s' if days != 1 else ''}, " if days else ""
+        return f"up {up}{hours}:{minutes:02d}, load average: {', '.join(load)}"
     except Exception:
         return "Unknown"
 
 # VPS monitoring task
+async def _check_one(user_id, vps, semaphore):
+    """Probe one VPS and suspend it if it exceeds the CPU/RAM thresholds, returns True if suspended"""
+    async with semaphore:
+        container = vps['container_name']
+        stats = await get_container_stats_bulk(container)
+        cpu = stats['cpu']
+        ram = stats['ram']
+        if cpu > CPU_THRESHOLD or ram > RAM_THRESHOLD:
+            reason = f"High resource usage: CPU {cpu:.1f}%, RAM {ram:.1f}% (threshold: {CPU_THRESHOLD}% CPU / {RAM_THRESHOLD}% RAM)"
+            logger.warning(f"Suspending {container}: {reason}")
+            try:
+                await execute_lxc("stop", container)
+                invalidate_container_stats(container)
+                update_vps(vps, status='suspended', suspended=True)
+                record_suspension(vps, reason, 'UnixNodes Auto-System')
+                # DM owner
+                try:
+                    owner = await get_user_cached(user_id)
+                    if owner:
+                        embed = create_warning_embed("🚨 VPS Auto-Suspended", f"Your VPS `{container}` has been automatically suspended due to high resource usage.\n\n**Reason:** {reason}\n\nContact UnixNodes admin to unsuspend and address the issue.")
+                        await owner.send(embed=embed)
+                except Exception as dm_e:
+                    logger.error(f"Failed to DM owner {user_id}: {dm_e}")
+                return True
+            except Exception as e:
+                logger.error(f"Failed to suspend {container}: {e}")
+        return False
+
 async def vps_monitor():
     """Monitor each VPS for high CPU/RAM usage every 10 minutes"""
+    semaphore = asyncio.Semaphore(MONITOR_CONCURRENCY)
     while True:
         try:
-            for user_id, vps_list in vps_data.items():
-                for vps in vps_list:
-                    if vps.get('status') == 'running' and not vps.get('suspended', False):
-                        container = vps['container_name']
-                        cpu = await get_container_cpu_pct(container)
-                        ram = await get_container_ram_pct(container)
-                        if cpu > CPU_THRESHOLD or ram > RAM_THRESHOLD:
-                            reason = f"High resource usage: CPU {cpu:.1f}%, RAM {ram:.1f}% (threshold: {CPU_THRESHOLD}% CPU / {RAM_THRESHOLD}% RAM)"
-                            logger.warning(f"Suspending {container}: {reason}")
-                            try:
-                                await execute_lxc(f"lxc stop {container}")
-                                vps['status'] = 'suspended'
-                                vps['suspended'] = True
-                                if 'suspension_history' not in vps:
-                                    vps['suspension_history'] = []
-                                vps['suspension_history'].append({
-                                    'time': datetime.now().isoformat(),
-                                    'reason': reason,
-                                    'by': 'UnixNodes Auto-System'
-                                })
-                                save_data()
-                                # DM owner
-                                try:
-                                    owner = await bot.fetch_user(int(user_id))
-                                    embed = create_warning_embed("🚨 VPS Auto-Suspended", f"Your VPS `{container}` has been automatically suspended due to high resource usage.\n\n**Reason:** {reason}\n\nContact UnixNodes admin to unsuspend and address the issue.")
-                                    await owner.send(embed=embed)
-                                except Exception as dm_e:
-                                    logger.error(f"Failed to DM owner {user_id}: {dm_e}")
-                            except Exception as e:
-                                logger.error(f"Failed to suspend {container}: {e}")
+            checked = [
+                (user_id, vps)
+                for user_id, vps in container_index.values()
+                if vps.get('status') == 'running' and not vps['suspended']
+            ]
+            results = await asyncio.gather(*(_check_one(user_id, vps, semaphore) for user_id, vps in checked), return_exceptions=True)
+            # Persist every suspension of this pass in one write
+            dirty = set()
+            for (user_id, _), result in zip(checked, results):
+                if isinstance(result, Exception):
+                    logger.error(f"VPS monitor check failed: {result}")
+                elif result:
+                    dirty.add(user_id)
+            if dirty:
+                save_users(*dirty)
             await asyncio.sleep(CHECK_INTERVAL)
         except Exception as e:
             logger.error(f"VPS monitor error: {e}")
             await asyncio.sleep(60)
 
+# Discord user cache for listing commands, spares a REST round-trip per user on repeat runs
+USER_CACHE_TTL = 3600
+USER_CACHE_SIZE = 10000
+_user_cache = {}  # user_id -> (expires_at, user or None)
+
+async def get_user_cached(user_id):
+    """Get a Discord user by ID, None if it doesn't exist or can't be fetched"""
+    user_id = int(user_id)
+    entry = _user_cache.get(user_id)
+    if entry and entry[0] > time.monotonic():
+        return entry[1]
+    user = bot.get_user(user_id)
+    if user is None:
+        try:
+            user = await bot.fetch_user(user_id)
+        except discord.NotFound:
+            user = None
+        except discord.HTTPException as e:
+            # Transient failure, don't cache it
+            logger.warning(f"Could not fetch user {user_id}: {e}")
+            return None
+    if len(_user_cache) >= USER_CACHE_SIZE:
+        _user_cache.pop(next(iter(_user_cache)))
+    _user_cache[user_id] = (time.monotonic() + USER_CACHE_TTL, user)
+    return user
+
 # Bot events
+background_tasks = []
+
 @bot.event
 async def on_ready():
     logger.info(f'{bot.user} has connected to Discord!')
     await bot.change_presence(activity=discord.Activity(type=discord.ActivityType.watching, name="UnixNodes VPS Manager"))
-    bot.loop.create_task(vps_monitor())
-    logger.info("UnixNodes Bot is ready! VPS monitoring started.")
+    # on_ready fires again after reconnects, start the background tasks only once
+    if not background_tasks:
+        background_tasks.append(bot.loop.create_task(vps_monitor()))
+        background_tasks.append(bot.loop.create_task(cpu_monitor()))
+        background_tasks.append(bot.loop.create_task(save_worker()))
+        background_tasks.append(bot.loop.create_task(ensure_template()))
+    logger.info("UnixNodes Bot is ready! VPS and CPU monitoring started.")
 
 @bot.event
 async def on_command_error(ctx, error):
@@ -472,11 +1075,8 @@ async def my_vps(ctx):
     embed = create_info_embed("My UnixNodes VPS", "")
     text = []
     for i, vps in enumerate(vps_list):
-        status = vps.get('status', 'unknown').upper()
-        if vps.get('suspended', False):
-            status += " (SUSPENDED)"
-        config = vps.get('config', 'Custom')
-        text.append(f"**VPS {i+1}:** `{vps['container_name']}` - {status} - {config}")
+        status = status_label(vps.get('status', 'unknown'), vps['suspended'])
+        text.append(f"**VPS {i+1}:** `{vps['container_name']}` - {status} - {config_str(vps)}")
     add_field(embed, "Your VPS", "\n".join(text), False)
     add_field(embed, "Actions", "Use `!manage` to start/stop/reinstall", False)
     await ctx.send(embed=embed)
@@ -486,7 +1086,7 @@ async def my_vps(ctx):
 async def lxc_list(ctx):
     """List all LXC containers"""
     try:
-        result = await execute_lxc("lxc list")
+        result = await execute_lxc("list")
         embed = create_info_embed("UnixNodes LXC Containers List", result)
         await ctx.send(embed=embed)
     except Exception as e:
@@ -511,31 +1111,23 @@ async def create_vps(ctx, ram: int, cpu: int, disk: int, user: discord.Member):
     await ctx.send(embed=create_info_embed("Creating UnixNodes VPS", f"Deploying VPS for {user.mention}..."))
 
     try:
-        # Fixed: Use init for config before start
-        await execute_lxc(f"lxc init ubuntu:22.04 {container_name} --storage {DEFAULT_STORAGE_POOL}")
-        await execute_lxc(f"lxc config set {container_name} limits.memory {ram_mb}MB")
-        await execute_lxc(f"lxc config set {container_name} limits.cpu {cpu}")
-        
-        # Always resize the disk to specified size
-        await execute_lxc(f"lxc config device set {container_name} root size {disk}GB")
-        # Start to apply changes
-        await execute_lxc(f"lxc start {container_name}")
+        await provision_container(container_name, ram_mb, cpu, disk)
 
-        config_str = f"{ram}GB RAM / {cpu} CPU / {disk}GB Disk"
         vps_info = {
             "container_name": container_name,
-            "ram": f"{ram}GB",
-            "cpu": str(cpu),
-            "storage": f"{disk}GB",
-            "config": config_str,
+            "ram": ram,
+            "cpu": cpu,
+            "storage": disk,
             "status": "running",
             "suspended": False,
             "suspension_history": [],
             "created_at": datetime.now().isoformat(),
-            "shared_with": []
+            "shared_with": set()
         }
         vps_data[user_id].append(vps_info)
-        save_data()
+        container_index[container_name] = (user_id, vps_info)
+        _account(vps_info, 1)
+        save_users(user_id)
 
         # Get or create VPS role and assign to user
         if ctx.guild:
@@ -557,7 +1149,7 @@ async def create_vps(ctx, ram: int, cpu: int, disk: int, user: discord.Member):
         # Send comprehensive DM to user
         try:
             dm_embed = create_success_embed("UnixNodes VPS Created!", f"Your VPS has been successfully deployed by an admin!")
-            add_field(dm_embed, "VPS Details", f"**VPS ID:** #{vps_count}\n**Container Name:** `{container_name}`\n**Configuration:** {config_str}\n**Status:** Running\n**Created:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}", False)
+            add_field(dm_embed, "VPS Details", f"**VPS ID:** #{vps_count}\n**Container Name:** `{container_name}`\n**Configuration:** {config_str(vps_info)}\n**Status:** Running\n**Created:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}", False)
             add_field(dm_embed, "Management", "• Use `!manage` to start/stop/reinstall your UnixNodes VPS\n• Use `!manage` → SSH for terminal access\n• Contact UnixNodes admin for upgrades or issues", False)
             add_field(dm_embed, "Important Notes", "• Full root access via SSH\n• Ubuntu 22.04 pre-installed\n• Back up your data regularly with UnixNodes tools", False)
             await user.send(embed=dm_embed)
@@ -567,6 +1159,70 @@ async def create_vps(ctx, ram: int, cpu: int, disk: int, user: discord.Member):
     except Exception as e:
         await ctx.send(embed=create_error_embed("Creation Failed", f"Error: {str(e)}"))
 
+# Cache of the multi-VPS selection embed, keyed on what it renders
+MANAGE_EMBED_CACHE_SIZE = 128
+_manage_view_cache = {}
+
+def get_vps_list_embed(user_id, vps_list):
+    """Build or reuse the "Available VPS" embed shown by !manage for users with several VPS"""
+    key = (user_id, tuple((v['container_name'], v.get('status', 'unknown')) for v in vps_list))
+    embed = _manage_view_cache.get(key)
+    if embed is None:
+        embed = create_embed("UnixNodes VPS Management", "Select a VPS from the dropdown menu below.", 0x1a1a1a)
+        add_field(embed, "Available VPS", "\n".join(f"**VPS {i+1}:** `{name}` - Status: `{status.upper()}`" for i, (name, status) in enumerate(key[1])), False)
+        if len(_manage_view_cache) >= MANAGE_EMBED_CACHE_SIZE:
+            # Evict the oldest entry, dicts keep insertion order
+            del _manage_view_cache[next(iter(_manage_view_cache))]
+        _manage_view_cache[key] = embed
+        return embed
+    # A reused embed still carries the time it was built, restamp it
+    return set_footer(embed)
+
+class ReinstallConfirmView(discord.ui.View):
+    def __init__(self, parent_view, container_name, vps, owner_id, selected_index):
+        super().__init__(timeout=60)
+        self.parent_view = parent_view
+        self.container_name = container_name
+        self.vps = vps
+        self.owner_id = owner_id
+        self.selected_index = selected_index
+
+    @discord.ui.button(label="Confirm", style=discord.ButtonStyle.danger)
+    async def confirm(self, interaction: discord.Interaction, item: discord.ui.Button):
+        await interaction.response.defer(ephemeral=True)
+        # One progress message, edited in place for every step
+        progress = None
+        try:
+            # Force delete the container first
+            progress = await interaction.followup.send(embed=create_info_embed("Deleting Container", f"Forcefully removing container `{self.container_name}`..."), ephemeral=True, wait=True)
+            await execute_lxc("delete", self.container_name, "--force")
+
+            # Recreate with original specifications - Fixed init + start
+            await progress.edit(embed=create_info_embed("Recreating Container", f"Creating new UnixNodes container `{self.container_name}`..."))
+            await provision_container(self.container_name, self.vps["ram"] * 1024, self.vps["cpu"], self.vps["storage"])
+            invalidate_container_stats(self.container_name)
+
+            update_vps(self.vps, status="running", suspended=False)
+            self.vps["created_at"] = datetime.now().isoformat()
+            self.vps.pop("tmate_installed", None)
+            save_users(self.owner_id)
+
+            # The result and the updated VPS embed go out in the same edit
+            new_embed = await self.parent_view.create_vps_embed(self.parent_view.selected_index)
+            await progress.edit(embeds=[create_success_embed("Reinstall Complete", f"UnixNodes VPS `{self.container_name}` has been successfully reinstalled!"), new_embed])
+
+        except Exception as e:
+            error_embed = create_error_embed("Reinstall Failed", f"Error: {str(e)}")
+            if progress:
+                await progress.edit(embed=error_embed)
+            else:
+                await interaction.followup.send(embed=error_embed, ephemeral=True)
+
+    @discord.ui.button(label="Cancel", style=discord.ButtonStyle.secondary)
+    async def cancel(self, interaction: discord.Interaction, item: discord.ui.Button):
+        new_embed = await self.parent_view.create_vps_embed(self.parent_view.selected_index)
+        await interaction.response.edit_message(embed=new_embed, view=self.parent_view)
+
 class ManageView(discord.ui.View):
     def __init__(self, user_id, vps_list, is_shared=False, owner_id=None, is_admin=False):
         super().__init__(timeout=300)
@@ -576,11 +1232,12 @@ class ManageView(discord.ui.View):
         self.is_shared = is_shared
         self.owner_id = owner_id or user_id
         self.is_admin = is_admin
+        self._embed_cache = {}  # index -> (spec key, embed, live usage field index)
 
         if len(vps_list) > 1:
             options = [
                 discord.SelectOption(
-                    label=f"UnixNodes VPS {i+1} ({v.get('config', 'Custom')})",
+                    label=f"UnixNodes VPS {i+1} ({config_str(v)})",
                     description=f"Status: {v.get('status', 'unknown')}",
                     value=str(i)
                 ) for i, v in enumerate(vps_list)
@@ -588,8 +1245,7 @@ class ManageView(discord.ui.View):
             self.select = discord.ui.Select(placeholder="Select a UnixNodes VPS to manage", options=options)
             self.select.callback = self.select_vps
             self.add_item(self.select)
-            self.initial_embed = create_embed("UnixNodes VPS Management", "Select a VPS from the dropdown menu below.", 0x1a1a1a)
-            add_field(self.initial_embed, "Available VPS", "\n".join([f"**VPS {i+1}:** `{v['container_name']}` - Status: `{v.get('status', 'unknown').upper()}`" for i, v in enumerate(vps_list)]), False)
+            self.initial_embed = get_vps_list_embed(user_id, vps_list)
         else:
             self.selected_index = 0
             self.initial_embed = None
@@ -604,19 +1260,26 @@ class ManageView(discord.ui.View):
     async def create_vps_embed(self, index):
         vps = self.vps_list[index]
         status = vps.get('status', 'unknown')
-        suspended = vps.get('suspended', False)
+        suspended = vps['suspended']
         status_color = 0x00ff88 if status == 'running' and not suspended else 0xffaa00 if suspended else 0xff3366
 
         # Fetch live stats
         container_name = vps['container_name']
-        lxc_status = await get_container_status(container_name)
-        cpu_usage = await get_container_cpu(container_name)
-        memory_usage = await get_container_memory(container_name)
-        disk_usage = await get_container_disk(container_name)
+        stats = await get_container_stats_bulk(container_name)
+        cpu_usage = f"{stats['cpu']:.1f}%"
+        memory_usage = stats['memory']
+        disk_usage = stats['disk']
+        live_stats = f"**CPU Usage:** {cpu_usage}\n**Memory:** {memory_usage}\n**Disk:** {disk_usage}"
 
-        status_text = f"{status.upper()}"
-        if suspended:
-            status_text += " (SUSPENDED)"
+        # While status and specs are unchanged only the live usage and footer differ, patch those in place
+        key = (status, suspended, vps['ram'], vps['cpu'], vps['storage'])
+        cached = self._embed_cache.get(index)
+        if cached and cached[0] == key:
+            _, embed, live_index = cached
+            set_field(embed, live_index, "📈 Live Usage", live_stats, False)
+            return set_footer(embed)
+
+        status_text = status_label(status, suspended)
 
         owner_text = ""
         if self.is_admin and self.owner_id != self.user_id:
@@ -632,38 +1295,37 @@ class ManageView(discord.ui.View):
             status_color
         )
 
-        resource_info = f"**Configuration:** {vps.get('config', 'Custom')}\n"
+        resource_info = f"**Configuration:** {config_str(vps)}\n"
         resource_info += f"**Status:** `{status_text}`\n"
-        resource_info += f"**RAM:** {vps['ram']}\n"
-        resource_info += f"**CPU:** {vps['cpu']} Cores\n"
-        resource_info += f"**Storage:** {vps['storage']}"
+        resource_info += specs_str(vps)
 
         add_field(embed, "📊 Allocated Resources", resource_info, False)
 
         if suspended:
             add_field(embed, "⚠️ Suspended", "This UnixNodes VPS is suspended. Contact an admin to unsuspend.", False)
 
-        live_stats = f"**CPU Usage:** {cpu_usage}\n**Memory:** {memory_usage}\n**Disk:** {disk_usage}"
+        live_index = len(embed.fields)
         add_field(embed, "📈 Live Usage", live_stats, False)
 
         add_field(embed, "🎮 Controls", "Use the buttons below to manage your UnixNodes VPS", False)
 
+        self._embed_cache[index] = (key, embed, live_index)
         return embed
 
     def add_action_buttons(self):
         if not self.is_shared and not self.is_admin:
             reinstall_button = discord.ui.Button(label="🔄 Reinstall", style=discord.ButtonStyle.danger)
-            reinstall_button.callback = lambda inter: self.action_callback(inter, 'reinstall')
+            reinstall_button.callback = functools.partial(self.action_callback, action='reinstall')
             self.add_item(reinstall_button)
 
         start_button = discord.ui.Button(label="▶ Start", style=discord.ButtonStyle.success)
-        start_button.callback = lambda inter: self.action_callback(inter, 'start')
+        start_button.callback = functools.partial(self.action_callback, action='start')
         stop_button = discord.ui.Button(label="⏸ Stop", style=discord.ButtonStyle.secondary)
-        stop_button.callback = lambda inter: self.action_callback(inter, 'stop')
+        stop_button.callback = functools.partial(self.action_callback, action='stop')
         ssh_button = discord.ui.Button(label="🔑 SSH", style=discord.ButtonStyle.primary)
-        ssh_button.callback = lambda inter: self.action_callback(inter, 'tmate')
+        ssh_button.callback = functools.partial(self.action_callback, action='tmate')
         stats_button = discord.ui.Button(label="📊 Stats", style=discord.ButtonStyle.secondary)
-        stats_button.callback = lambda inter: self.action_callback(inter, 'stats')
+        stats_button.callback = functools.partial(self.action_callback, action='stats')
 
         self.add_item(start_button)
         self.add_item(stop_button)
@@ -690,7 +1352,7 @@ class ManageView(discord.ui.View):
         else:
             vps = self.vps_list[self.selected_index]
         
-        suspended = vps.get('suspended', False)
+        suspended = vps['suspended']
         if suspended and not self.is_admin and action != 'stats':
             await interaction.response.send_message(embed=create_error_embed("Access Denied", "This UnixNodes VPS is suspended. Contact an admin to unsuspend."), ephemeral=True)
             return
@@ -698,15 +1360,12 @@ class ManageView(discord.ui.View):
         container_name = vps["container_name"]
 
         if action == 'stats':
-            status = await get_container_status(container_name)
-            cpu_usage = await get_container_cpu(container_name)
-            memory_usage = await get_container_memory(container_name)
-            disk_usage = await get_container_disk(container_name)
+            stats = await get_container_stats_bulk(container_name)
             stats_embed = create_info_embed("📈 UnixNodes Live Statistics", f"Real-time stats for `{container_name}`")
-            add_field(stats_embed, "Status", f"`{status.upper()}`", True)
-            add_field(stats_embed, "CPU", cpu_usage, True)
-            add_field(stats_embed, "Memory", memory_usage, True)
-            add_field(stats_embed, "Disk", disk_usage, True)
+            add_field(stats_embed, "Status", f"`{stats['status'].upper()}`", True)
+            add_field(stats_embed, "CPU", f"{stats['cpu']:.1f}%", True)
+            add_field(stats_embed, "Memory", stats['memory'], True)
+            add_field(stats_embed, "Disk", stats['disk'], True)
             await interaction.response.send_message(embed=stats_embed, ephemeral=True)
             return
 
@@ -722,69 +1381,18 @@ class ManageView(discord.ui.View):
                 f"⚠️ **WARNING:** This will erase all data on VPS `{container_name}` and reinstall Ubuntu 22.04.\n\n"
                 f"This action cannot be undone. Continue?")
 
-            class ConfirmView(discord.ui.View):
-                def __init__(self, parent_view, container_name, vps, owner_id, selected_index):
-                    super().__init__(timeout=60)
-                    self.parent_view = parent_view
-                    self.container_name = container_name
-                    self.vps = vps
-                    self.owner_id = owner_id
-                    self.selected_index = selected_index
-
-                @discord.ui.button(label="Confirm", style=discord.ButtonStyle.danger)
-                async def confirm(self, interaction: discord.Interaction, item: discord.ui.Button):
-                    await interaction.response.defer(ephemeral=True)
-                    try:
-                        # Force delete the container first
-                        await interaction.followup.send(embed=create_info_embed("Deleting Container", f"Forcefully removing container `{self.container_name}`..."), ephemeral=True)
-                        await execute_lxc(f"lxc delete {self.container_name} --force")
-
-                        # Recreate with original specifications - Fixed init + start
-                        await interaction.followup.send(embed=create_info_embed("Recreating Container", f"Creating new UnixNodes container `{self.container_name}`..."), ephemeral=True)
-                        original_ram = self.vps["ram"]
-                        original_cpu = self.vps["cpu"]
-                        original_storage = self.vps["storage"]
-                        ram_gb = int(original_ram.replace("GB", ""))
-                        ram_mb = ram_gb * 1024
-                        storage_gb = int(original_storage.replace("GB", ""))
-
-                        await execute_lxc(f"lxc init ubuntu:22.04 {self.container_name} --storage {DEFAULT_STORAGE_POOL}")
-                        await execute_lxc(f"lxc config set {self.container_name} limits.memory {ram_mb}MB")
-                        await execute_lxc(f"lxc config set {self.container_name} limits.cpu {original_cpu}")
-                        await execute_lxc(f"lxc config device set {self.container_name} root size {storage_gb}GB")
-                        await execute_lxc(f"lxc start {self.container_name}")
-
-                        self.vps["status"] = "running"
-                        self.vps["suspended"] = False
-                        self.vps["created_at"] = datetime.now().isoformat()
-                        config_str = f"{ram_gb}GB RAM / {original_cpu} CPU / {storage_gb}GB Disk"
-                        self.vps["config"] = config_str
-                        save_data()
-                        await interaction.followup.send(embed=create_success_embed("Reinstall Complete", f"UnixNodes VPS `{self.container_name}` has been successfully reinstalled!"), ephemeral=True)
-
-                        # Edit the original message if possible, but since ephemeral, send updated embed as followup
-                        new_embed = await self.parent_view.create_vps_embed(self.parent_view.selected_index)
-                        await interaction.followup.send(embed=new_embed, ephemeral=True)
-
-                    except Exception as e:
-                        await interaction.followup.send(embed=create_error_embed("Reinstall Failed", f"Error: {str(e)}"), ephemeral=True)
-
-                @discord.ui.button(label="Cancel", style=discord.ButtonStyle.secondary)
-                async def cancel(self, interaction: discord.Interaction, item: discord.ui.Button):
-                    new_embed = await self.parent_view.create_vps_embed(self.parent_view.selected_index)
-                    await interaction.response.edit_message(embed=new_embed, view=self.parent_view)
-
-            await interaction.response.send_message(embed=confirm_embed, view=ConfirmView(self, container_name, vps, self.owner_id, self.selected_index), ephemeral=True)
+            await interaction.response.send_message(embed=confirm_embed, view=ReinstallConfirmView(self, container_name, vps, self.owner_id, self.selected_index), ephemeral=True)
 
         elif action == 'start':
             await interaction.response.defer(ephemeral=True)
             if suspended:
-                vps['suspended'] = False
-                save_data()
+                update_vps(vps, suspended=False)
+                save_users(self.owner_id)
             try:
-                await execute_lxc(f"lxc start {container_name}")
-                vps["status"] = "running"
-                save_data()
+                await execute_lxc("start", container_name)
+                invalidate_container_stats(container_name)
+                update_vps(vps, status="running")
+                save_users(self.owner_id)
                 await interaction.followup.send(embed=create_success_embed("VPS Started", f"UnixNodes VPS `{container_name}` is now running!"), ephemeral=True)
                 new_embed = await self.create_vps_embed(self.selected_index)
                 await interaction.message.edit(embed=new_embed, view=self)
@@ -794,12 +1402,13 @@ class ManageView(discord.ui.View):
         elif action == 'stop':
             await interaction.response.defer(ephemeral=True)
             if suspended:
-                vps['suspended'] = False
-                save_data()
+                update_vps(vps, suspended=False)
+                save_users(self.owner_id)
             try:
-                await execute_lxc(f"lxc stop {container_name}", timeout=120)
-                vps["status"] = "stopped"
-                save_data()
+                await execute_lxc("stop", container_name, timeout=120)
+                invalidate_container_stats(container_name)
+                update_vps(vps, status="stopped")
+                save_users(self.owner_id)
                 await interaction.followup.send(embed=create_success_embed("VPS Stopped", f"UnixNodes VPS `{container_name}` has been stopped!"), ephemeral=True)
                 new_embed = await self.create_vps_embed(self.selected_index)
                 await interaction.message.edit(embed=new_embed, view=self)
@@ -813,33 +1422,33 @@ class ManageView(discord.ui.View):
             await interaction.response.send_message(embed=create_info_embed("SSH Access", "Generating UnixNodes SSH connection..."), ephemeral=True)
 
             try:
-                # Check if tmate exists
-                check_proc = await asyncio.create_subprocess_exec(
-                    "lxc", "exec", container_name, "--", "which", "tmate",
-                    stdout=asyncio.subprocess.PIPE,
-                    stderr=asyncio.subprocess.PIPE
-                )
-                stdout, stderr = await check_proc.communicate()
-
-                if check_proc.returncode != 0:
-                    await interaction.followup.send(embed=create_info_embed("Installing SSH", "Installing tmate..."), ephemeral=True)
-                    await execute_lxc(f"lxc exec {container_name} -- sudo apt-get update -y")
-                    await execute_lxc(f"lxc exec {container_name} -- sudo apt-get install tmate -y")
-                    await interaction.followup.send(embed=create_success_embed("Installed", "UnixNodes SSH service installed!"), ephemeral=True)
-
-                # Start tmate with unique session name using timestamp
-                session_name = f"unixnodes-session-{datetime.now().strftime('%Y%m%d%H%M%S')}"
-                await execute_lxc(f"lxc exec {container_name} -- tmate -S /tmp/{session_name}.sock new-session -d")
-                await asyncio.sleep(3)
-
-                # Get SSH link
-                ssh_proc = await asyncio.create_subprocess_exec(
-                    "lxc", "exec", container_name, "--", "tmate", "-S", f"/tmp/{session_name}.sock", "display", "-p", "#{tmate_ssh}",
-                    stdout=asyncio.subprocess.PIPE,
-                    stderr=asyncio.subprocess.PIPE
-                )
-                stdout, stderr = await ssh_proc.communicate()
-                ssh_url = stdout.decode().strip() if stdout else None
+                # One shell inside the container serves every step instead of an lxc exec per command
+                async with LxcShell(container_name) as shell:
+                    # tmate stays installed for the container's lifetime, only check for it until it's known to be there
+                    if not vps.get('tmate_installed'):
+                        code, output = await shell.run("which tmate")
+                        if code != 0:
+                            await interaction.edit_original_response(embed=create_info_embed("Installing SSH", "Installing tmate..."))
+                            for command in ("sudo apt-get update -y", "sudo apt-get install tmate -y"):
+                                code, output = await shell.run(command)
+                                if code != 0:
+                                    raise Exception(output[-1000:] or "Command failed with no error output")
+                            await interaction.edit_original_response(embed=create_success_embed("Installed", "UnixNodes SSH service installed!"))
+                        vps['tmate_installed'] = True
+                        save_users(self.owner_id)
+
+                    # Start tmate with unique session name from the clock in ns, then wait until it has its SSH link
+                    session_name = f"unixnodes-session-{time.time_ns():x}"
+                    socket_path = f"/tmp/{session_name}.sock"
+                    code, output = await shell.run(f"tmate -S {socket_path} new-session -d && tmate -S {socket_path} wait tmate-ready", timeout=30)
+                    if code == 127:
+                        # tmate was removed from inside the container, check again next time
+                        vps.pop('tmate_installed', None)
+                        save_users(self.owner_id)
+                    elif code == 0:
+                        # Get SSH link
+                        code, output = await shell.run(f"tmate -S {socket_path} display -p '#{{tmate_ssh}}'")
+                ssh_url = output if code == 0 else None
 
                 if ssh_url:
                     try:
@@ -848,14 +1457,14 @@ class ManageView(discord.ui.View):
                         add_field(ssh_embed, "⚠️ Security", "This link is temporary. Do not share it.", False)
                         add_field(ssh_embed, "📝 Session", f"Session ID: {session_name}", False)
                         await interaction.user.send(embed=ssh_embed)
-                        await interaction.followup.send(embed=create_success_embed("SSH Sent", f"Check your DMs for UnixNodes SSH link! Session: {session_name}"), ephemeral=True)
+                        await interaction.edit_original_response(embed=create_success_embed("SSH Sent", f"Check your DMs for UnixNodes SSH link! Session: {session_name}"))
                     except discord.Forbidden:
-                        await interaction.followup.send(embed=create_error_embed("DM Failed", "Enable DMs to receive UnixNodes SSH link!"), ephemeral=True)
+                        await interaction.edit_original_response(embed=create_error_embed("DM Failed", "Enable DMs to receive UnixNodes SSH link!"))
                 else:
-                    error_msg = stderr.decode().strip() if stderr else "Unknown error"
-                    await interaction.followup.send(embed=create_error_embed("SSH Failed", error_msg), ephemeral=True)
+                    error_msg = output or "Unknown error"
+                    await interaction.edit_original_response(embed=create_error_embed("SSH Failed", error_msg))
             except Exception as e:
-                await interaction.followup.send(embed=create_error_embed("SSH Error", str(e)), ephemeral=True)
+                await interaction.edit_original_response(embed=create_error_embed("SSH Error", str(e)))
 
 @bot.command(name='manage')
 async def manage_vps(ctx, user: discord.Member = None):
@@ -863,8 +1472,7 @@ async def manage_vps(ctx, user: discord.Member = None):
     # Check if user is trying to manage someone else's VPS
     if user:
         # Only admins can manage other users' VPS
-        user_id_check = str(ctx.author.id)
-        if user_id_check != str(MAIN_ADMIN_ID) and user_id_check not in admin_data.get("admins", []):
+        if not user_is_admin(ctx.author.id):
             await ctx.send(embed=create_error_embed("Access Denied", "Only UnixNodes admins can manage other users' VPS."))
             return
         
@@ -894,74 +1502,68 @@ async def manage_vps(ctx, user: discord.Member = None):
 @is_admin()
 async def list_all_vps(ctx):
     """List all UnixNodes VPS and user information (Admin only)"""
-    total_vps = 0
     total_users = len(vps_data)
-    running_vps = 0
-    stopped_vps = 0
-    suspended_vps = 0
-    
-    vps_info = []
-    user_summary = []
-    
-    for user_id, vps_list in vps_data.items():
-        try:
-            user = await bot.fetch_user(int(user_id))
-            user_vps_count = len(vps_list)
-            user_running = sum(1 for vps in vps_list if vps.get('status') == 'running' and not vps.get('suspended', False))
-            user_stopped = sum(1 for vps in vps_list if vps.get('status') == 'stopped')
-            user_suspended = sum(1 for vps in vps_list if vps.get('suspended', True))
-            
-            total_vps += user_vps_count
-            running_vps += user_running
-            stopped_vps += user_stopped
-            suspended_vps += user_suspended
-            
-            # User summary
-            user_summary.append(f"**{user.name}** ({user.mention}) - {user_vps_count} UnixNodes VPS ({user_running} running, {user_suspended} suspended)")
-            
-            # Individual VPS details
-            for i, vps in enumerate(vps_list):
-                status_emoji = "🟢" if vps.get('status') == 'running' and not vps.get('suspended', False) else "🟡" if vps.get('suspended', False) else "🔴"
-                status_text = vps.get('status', 'unknown').upper()
-                if vps.get('suspended', False):
-                    status_text += " (SUSPENDED)"
-                vps_info.append(f"{status_emoji} **{user.name}** - VPS {i+1}: `{vps['container_name']}` - {vps.get('config', 'Custom')} - {status_text}")
-                
-        except discord.NotFound:
-            vps_info.append(f"❓ Unknown User ({user_id}) - {len(vps_list)} UnixNodes VPS")
-    
-    # Create multiple embeds if needed to avoid character limit
-    embeds = []
-    
-    # First embed with overview
+    total_vps = vps_totals["vps"]
+    running_vps = vps_totals["running"]
+    suspended_vps = vps_totals["suspended"]
+    stopped_vps = total_vps - running_vps - suspended_vps
+
+    # First embed with overview, straight from the counters
     embed = create_embed("All UnixNodes VPS Information", "Complete overview of all UnixNodes VPS deployments and user statistics", 0x1a1a1a)
     add_field(embed, "System Overview", f"**Total Users:** {total_users}\n**Total VPS:** {total_vps}\n**Running:** {running_vps}\n**Stopped:** {stopped_vps}\n**Suspended:** {suspended_vps}", False)
-    embeds.append(embed)
-    
-    # User summary embed
-    if user_summary:
-        embed = create_embed("UnixNodes User Summary", f"Summary of all users and their UnixNodes VPS", 0x1a1a1a)
-        # Split user summary into chunks to avoid character limit
-        for i in range(0, len(user_summary), 10):
-            chunk = user_summary[i:i+10]
-            summary_text = "\n".join(chunk)
-            if i == 0:
-                add_field(embed, "Users", summary_text, False)
-            else:
-                add_field(embed, f"Users (continued {i+1}-{min(i+10, len(user_summary))})", summary_text, False)
-        embeds.append(embed)
+    await ctx.send(embed=embed)
     
-    # VPS details embeds
-    if vps_info:
-        # Split VPS info into chunks to avoid character limit
-        for i in range(0, len(vps_info), 15):
-            chunk = vps_info[i:i+15]
-            embed = create_embed(f"UnixNodes VPS Details ({i+1}-{min(i+15, len(vps_info))})", "List of all UnixNodes VPS deployments", 0x1a1a1a)
-            add_field(embed, "VPS List", "\n".join(chunk), False)
-            embeds.append(embed)
+    # Resolve every owner concurrently instead of one REST round-trip after another
+    entries = list(vps_data.items())
+    users = await asyncio.gather(*(get_user_cached(user_id) for user_id, _ in entries))
+    owners = list(zip(entries, users))
+
+    def iter_user_summary():
+        for (user_id, vps_list), user in owners:
+            if user is None:
+                continue
+            user_running = user_suspended = 0
+            for vps in vps_list:
+                if vps['suspended']:
+                    user_suspended += 1
+                elif vps.get('status') == 'running':
+                    user_running += 1
+            yield f"**{user.name}** ({user.mention}) - {len(vps_list)} UnixNodes VPS ({user_running} running, {user_suspended} suspended)"
+
+    def iter_vps_lines():
+        for (user_id, vps_list), user in owners:
+            if user is None:
+                yield f"❓ Unknown User ({user_id}) - {len(vps_list)} UnixNodes VPS"
+                continue
+            for i, vps in enumerate(vps_list):
+                status = vps.get('status', 'unknown')
+                suspended = vps['suspended']
+                status_emoji = "🟡" if suspended else "🟢" if status == 'running' else "🔴"
+                status_text = status_label(status, suspended)
+                yield f"{status_emoji} **{user.name}** - VPS {i+1}: `{vps['container_name']}` - {config_str(vps)} - {status_text}"
+
+    # User summary embed, split into fields of 10 users to avoid the character limit. Formatting stops
+    # once the embed is out of room, users past that point would be dropped by Discord anyway
+    embed = None
+    known_users = sum(1 for _, user in owners if user is not None)
+    for start, chunk in iter_chunks(iter_user_summary(), 10):
+        value = truncate_text("\n".join(chunk), 1024)
+        if embed is None:
+            embed = create_embed("UnixNodes User Summary", f"Summary of all users and their UnixNodes VPS", 0x1a1a1a)
+            add_field(embed, "Users", value, False)
+        # Leave room for this field's name and a closing "More Users" field
+        elif len(embed.fields) >= EMBED_MAX_FIELDS - 1 or len(embed) + len(value) > EMBED_MAX_CHARS - 200:
+            add_field(embed, "More Users", f"...and {known_users - start} more, see the VPS details below", False)
+            break
+        else:
+            add_field(embed, f"Users (continued {start+1}-{start+len(chunk)})", value, False)
+    if embed:
+        await ctx.send(embed=embed)
     
-    # Send all embeds
-    for embed in embeds:
+    # VPS details, each page of 15 is sent before the next is formatted
+    for start, chunk in iter_chunks(iter_vps_lines(), 15):
+        embed = create_embed(f"UnixNodes VPS Details ({start+1}-{start+len(chunk)})", "List of all UnixNodes VPS deployments", 0x1a1a1a)
+        add_field(embed, "VPS List", "\n".join(chunk), False)
         await ctx.send(embed=embed)
 
 @bot.command(name='manage-shared')
@@ -990,14 +1592,11 @@ async def share_user(ctx, shared_user: discord.Member, vps_number: int):
         return
     vps = vps_data[user_id][vps_number - 1]
 
-    if "shared_with" not in vps:
-        vps["shared_with"] = []
-
     if shared_user_id in vps["shared_with"]:
         await ctx.send(embed=create_error_embed("Already Shared", f"{shared_user.mention} already has access to this UnixNodes VPS!"))
         return
-    vps["shared_with"].append(shared_user_id)
-    save_data()
+    vps["shared_with"].add(shared_user_id)
+    save_users(user_id)
     await ctx.send(embed=create_success_embed("VPS Shared", f"UnixNodes VPS #{vps_number} shared with {shared_user.mention}!"))
     try:
         await shared_user.send(embed=create_embed("UnixNodes VPS Access Granted", f"You have access to VPS #{vps_number} from {ctx.author.mention}. Use `!manage-shared {ctx.author.mention} {vps_number}`", 0x00ff88))
@@ -1014,14 +1613,11 @@ async def revoke_share(ctx, shared_user: discord.Member, vps_number: int):
         return
     vps = vps_data[user_id][vps_number - 1]
 
-    if "shared_with" not in vps:
-        vps["shared_with"] = []
-
     if shared_user_id not in vps["shared_with"]:
         await ctx.send(embed=create_error_embed("Not Shared", f"{shared_user.mention} doesn't have access to this UnixNodes VPS!"))
         return
-    vps["shared_with"].remove(shared_user_id)
-    save_data()
+    vps["shared_with"].discard(shared_user_id)
+    save_users(user_id)
     await ctx.send(embed=create_success_embed("Access Revoked", f"Access to UnixNodes VPS #{vps_number} revoked from {shared_user.mention}!"))
     try:
         await shared_user.send(embed=create_embed("UnixNodes VPS Access Revoked", f"Your access to VPS #{vps_number} by {ctx.author.mention} has been revoked.", 0xff3366))
@@ -1042,8 +1638,11 @@ async def delete_vps(ctx, user: discord.Member, vps_number: int, *, reason: str
     await ctx.send(embed=create_info_embed("Deleting UnixNodes VPS", f"Removing VPS #{vps_number}..."))
 
     try:
-        await execute_lxc(f"lxc delete {container_name} --force")
+        await execute_lxc("delete", container_name, "--force")
+        invalidate_container_stats(container_name)
         del vps_data[user_id][vps_number - 1]
+        container_index.pop(container_name, None)
+        _account(vps, -1)
         if not vps_data[user_id]:
             del vps_data[user_id]
             # Remove VPS role if user has no more VPS
@@ -1054,7 +1653,7 @@ async def delete_vps(ctx, user: discord.Member, vps_number: int, *, reason: str
                         await user.remove_roles(vps_role, reason="No UnixNodes VPS ownership")
                     except discord.Forbidden:
                         logger.warning(f"Failed to remove UnixNodes VPS role from {user.name}")
-        save_data()
+        save_users(user_id)
 
         embed = create_success_embed("UnixNodes VPS Deleted Successfully")
         add_field(embed, "Owner", user.mention, True)
@@ -1075,31 +1674,20 @@ async def add_resources(ctx, vps_id: str, ram: int = None, cpu: int = None, disk
         return
     
     # Find the VPS in our database
-    found_vps = None
-    user_id = None
-    vps_index = None
-    
-    for uid, vps_list in vps_data.items():
-        for i, vps in enumerate(vps_list):
-            if vps['container_name'] == vps_id:
-                found_vps = vps
-                user_id = uid
-                vps_index = i
-                break
-        if found_vps:
-            break
-    
-    if not found_vps:
+    entry = container_index.get(vps_id)
+    if not entry:
         await ctx.send(embed=create_error_embed("VPS Not Found", f"No UnixNodes VPS found with ID: `{vps_id}`"))
         return
+    user_id, found_vps = entry
     
-    was_running = found_vps.get('status') == 'running' and not found_vps.get('suspended', False)
+    was_running = found_vps.get('status') == 'running' and not found_vps['suspended']
     if was_running:
         await ctx.send(embed=create_info_embed("Stopping VPS", f"Stopping UnixNodes VPS `{vps_id}` to apply resource changes..."))
         try:
-            await execute_lxc(f"lxc stop {vps_id}")
-            found_vps['status'] = 'stopped'
-            save_data()
+            await execute_lxc("stop", vps_id)
+            invalidate_container_stats(vps_id)
+            update_vps(found_vps, status='stopped')
+            save_users(user_id)
         except Exception as e:
             await ctx.send(embed=create_error_embed("Stop Failed", f"Error stopping VPS: {str(e)}"))
             return
@@ -1107,9 +1695,9 @@ async def add_resources(ctx, vps_id: str, ram: int = None, cpu: int = None, disk
     changes = []
     
     try:
-        current_ram_gb = int(found_vps['ram'].replace('GB', ''))
-        current_cpu = int(found_vps['cpu'])
-        current_disk_gb = int(found_vps['storage'].replace('GB', ''))
+        current_ram_gb = found_vps['ram']
+        current_cpu = found_vps['cpu']
+        current_disk_gb = found_vps['storage']
         
         new_ram_gb = current_ram_gb
         new_cpu = current_cpu
@@ -1119,36 +1707,33 @@ async def add_resources(ctx, vps_id: str, ram: int = None, cpu: int = None, disk
         if ram is not None and ram > 0:
             new_ram_gb += ram
             ram_mb = new_ram_gb * 1024
-            await execute_lxc(f"lxc config set {vps_id} limits.memory {ram_mb}MB")
+            await execute_lxc("config", "set", vps_id, "limits.memory", f"{ram_mb}MB")
             changes.append(f"RAM: +{ram}GB (New total: {new_ram_gb}GB)")
         
         # Add CPU if specified
         if cpu is not None and cpu > 0:
             new_cpu += cpu
-            await execute_lxc(f"lxc config set {vps_id} limits.cpu {new_cpu}")
+            await execute_lxc("config", "set", vps_id, "limits.cpu", str(new_cpu))
             changes.append(f"CPU: +{cpu} cores (New total: {new_cpu} cores)")
         
         # Add disk if specified
         if disk is not None and disk > 0:
             new_disk_gb += disk
-            await execute_lxc(f"lxc config device set {vps_id} root size {new_disk_gb}GB")
+            await execute_lxc("config", "device", "set", vps_id, "root", "size", f"{new_disk_gb}GB")
             changes.append(f"Disk: +{disk}GB (New total: {new_disk_gb}GB)")
         
         # Update VPS data
-        found_vps['ram'] = f"{new_ram_gb}GB"
-        found_vps['cpu'] = str(new_cpu)
-        found_vps['storage'] = f"{new_disk_gb}GB"
-        found_vps['config'] = f"{new_ram_gb}GB RAM / {new_cpu} CPU / {new_disk_gb}GB Disk"
+        update_vps(found_vps, ram=new_ram_gb, cpu=new_cpu, storage=new_disk_gb)
         
         # Save changes to database
-        vps_data[user_id][vps_index] = found_vps
-        save_data()
+        save_users(user_id)
         
         # Start the VPS if it was running before
         if was_running:
-            await execute_lxc(f"lxc start {vps_id}")
-            found_vps['status'] = 'running'
-            save_data()
+            await execute_lxc("start", vps_id)
+            invalidate_container_stats(vps_id)
+            update_vps(found_vps, status='running')
+            save_users(user_id)
         
         embed = create_success_embed("Resources Added", f"Successfully added resources to UnixNodes VPS `{vps_id}`")
         add_field(embed, "Changes Applied", "\n".join(changes), False)
@@ -1166,7 +1751,7 @@ async def admin_add(ctx, user: discord.Member):
         await ctx.send(embed=create_error_embed("Already Admin", "This user is already the main UnixNodes admin!"))
         return
 
-    if user_id in admin_data.get("admins", []):
+    if user.id in admin_set:
         await ctx.send(embed=create_error_embed("Already Admin", f"{user.mention} is already a UnixNodes admin!"))
         return
 
@@ -1174,7 +1759,8 @@ async def admin_add(ctx, user: discord.Member):
         admin_data["admins"] = []
 
     admin_data["admins"].append(user_id)
-    save_data()
+    admin_set.add(user.id)
+    save_admins()
     await ctx.send(embed=create_success_embed("Admin Added", f"{user.mention} is now a UnixNodes admin!"))
     try:
         await user.send(embed=create_embed("🎉 UnixNodes Admin Role Granted", f"You are now a UnixNodes admin by {ctx.author.mention}", 0x00ff88))
@@ -1190,12 +1776,13 @@ async def admin_remove(ctx, user: discord.Member):
         await ctx.send(embed=create_error_embed("Cannot Remove", "You cannot remove the main UnixNodes admin!"))
         return
 
-    if user_id not in admin_data.get("admins", []):
+    if user.id not in admin_set:
         await ctx.send(embed=create_error_embed("Not Admin", f"{user.mention} is not a UnixNodes admin!"))
         return
 
     admin_data["admins"].remove(user_id)
-    save_data()
+    admin_set.discard(user.id)
+    save_admins()
     await ctx.send(embed=create_success_embed("Admin Removed", f"{user.mention} is no longer a UnixNodes admin!"))
     try:
         await user.send(embed=create_embed("⚠️ UnixNodes Admin Role Revoked", f"Your admin role was removed by {ctx.author.mention}", 0xff3366))
@@ -1207,18 +1794,20 @@ async def admin_remove(ctx, user: discord.Member):
 async def admin_list(ctx):
     """List all UnixNodes admins (Main admin only)"""
     admins = admin_data.get("admins", [])
-    main_admin = await bot.fetch_user(MAIN_ADMIN_ID)
+    main_admin, *admin_users = await asyncio.gather(
+        bot.fetch_user(MAIN_ADMIN_ID),
+        *(get_user_cached(admin_id) for admin_id in admins)
+    )
 
     embed = create_embed("👑 UnixNodes Admin Team", "Current UnixNodes administrators:", 0x1a1a1a)
     add_field(embed, "🔰 Main Admin", f"{main_admin.mention} (ID: {MAIN_ADMIN_ID})", False)
 
     if admins:
         admin_list = []
-        for admin_id in admins:
-            try:
-                admin_user = await bot.fetch_user(int(admin_id))
+        for admin_id, admin_user in zip(admins, admin_users):
+            if admin_user:
                 admin_list.append(f"• {admin_user.mention} (ID: {admin_id})")
-            except:
+            else:
                 admin_list.append(f"• Unknown User (ID: {admin_id})")
 
         admin_text = "\n".join(admin_list)
@@ -1252,21 +1841,20 @@ async def user_info(ctx, user: discord.Member):
         suspended_count = 0
 
         for i, vps in enumerate(vps_list):
-            status_emoji = "🟢" if vps.get('status') == 'running' and not vps.get('suspended', False) else "🟡" if vps.get('suspended', False) else "🔴"
-            status_text = vps.get('status', 'unknown').upper()
-            if vps.get('suspended', False):
-                status_text += " (SUSPENDED)"
+            status = vps.get('status', 'unknown')
+            suspended = vps['suspended']
+            status_emoji = "🟡" if suspended else "🟢" if status == 'running' else "🔴"
+            status_text = status_label(status, suspended)
+            if suspended:
                 suspended_count += 1
-            else:
-                running_count += 1 if vps.get('status') == 'running' else 0
+            elif status == 'running':
+                running_count += 1
             vps_info.append(f"{status_emoji} VPS {i+1}: `{vps['container_name']}` - {status_text}")
 
             # Calculate totals
-            ram_gb = int(vps['ram'].replace('GB', ''))
-            storage_gb = int(vps['storage'].replace('GB', ''))
-            total_ram += ram_gb
-            total_cpu += int(vps['cpu'])
-            total_storage += storage_gb
+            total_ram += vps['ram']
+            total_cpu += vps['cpu']
+            total_storage += vps['storage']
 
         vps_summary = f"**Total VPS:** {len(vps_list)}\n**Running:** {running_count}\n**Suspended:** {suspended_count}\n**Total RAM:** {total_ram}GB\n**Total CPU:** {total_cpu} cores\n**Total Storage:** {total_storage}GB"
         add_field(embed, "🖥️ UnixNodes VPS Information", vps_summary, False)
@@ -1292,40 +1880,38 @@ async def user_info(ctx, user: discord.Member):
         await ctx.send(embed=embed)
 
     # Check if user is admin
-    is_admin_user = user_id == str(MAIN_ADMIN_ID) or user_id in admin_data.get("admins", [])
+    is_admin_user = user_is_admin(user.id)
     add_field(embed, "🛡️ UnixNodes Admin Status", f"**{'Yes' if is_admin_user else 'No'}**", False)
 
+# (figures key, embed) of the last serverstats reply
+_server_stats_cache = None
+
 @bot.command(name='serverstats')
 @is_admin()
 async def server_stats(ctx):
     """Show UnixNodes server statistics (Admin only)"""
+    global _server_stats_cache
     total_users = len(vps_data)
-    total_vps = sum(len(vps_list) for vps_list in vps_data.values())
+    total_admins = len(admin_data.get('admins', [])) + 1
+    key = (total_users, total_admins, tuple(vps_totals.values()))
 
-    # Calculate resources
-    total_ram = 0
-    total_cpu = 0
-    total_storage = 0
-    running_vps = 0
-    suspended_vps = 0
+    # Between mutations the figures are identical, reuse the last embed and only restamp its footer
+    if _server_stats_cache and _server_stats_cache[0] == key:
+        await ctx.send(embed=set_footer(_server_stats_cache[1]))
+        return
 
-    for vps_list in vps_data.values():
-        for vps in vps_list:
-            ram_gb = int(vps['ram'].replace('GB', ''))
-            storage_gb = int(vps['storage'].replace('GB', ''))
-            total_ram += ram_gb
-            total_cpu += int(vps['cpu'])
-            total_storage += storage_gb
-            if vps.get('status') == 'running':
-                if vps.get('suspended', False):
-                    suspended_vps += 1
-                else:
-                    running_vps += 1
+    total_vps = vps_totals["vps"]
+    running_vps = vps_totals["running"]
+    suspended_vps = vps_totals["suspended"]
+    total_ram = vps_totals["ram_gb"]
+    total_cpu = vps_totals["cpu"]
+    total_storage = vps_totals["storage_gb"]
 
     embed = create_embed("📊 UnixNodes Server Statistics", "Current UnixNodes server overview", 0x1a1a1a)
-    add_field(embed, "👥 Users", f"**Total Users:** {total_users}\n**Total Admins:** {len(admin_data.get('admins', [])) + 1}", False)
+    add_field(embed, "👥 Users", f"**Total Users:** {total_users}\n**Total Admins:** {total_admins}", False)
     add_field(embed, "🖥️ VPS", f"**Total VPS:** {total_vps}\n**Running:** {running_vps}\n**Suspended:** {suspended_vps}\n**Stopped:** {total_vps - running_vps - suspended_vps}", False)
     add_field(embed, "📈 Resources", f"**Total RAM:** {total_ram}GB\n**Total CPU:** {total_cpu} cores\n**Total Storage:** {total_storage}GB", False)
+    _server_stats_cache = (key, embed)
 
     await ctx.send(embed=embed)
 
@@ -1335,60 +1921,46 @@ async def vps_info(ctx, container_name: str = None):
     """Get detailed UnixNodes VPS information (Admin only)"""
     if not container_name:
         # Show all VPS
-        all_vps = []
-        for user_id, vps_list in vps_data.items():
-            try:
-                user = await bot.fetch_user(int(user_id))
+        entries = list(vps_data.items())
+        users = await asyncio.gather(*(get_user_cached(user_id) for user_id, _ in entries))
+
+        def iter_vps_lines():
+            for (user_id, vps_list), user in zip(entries, users):
+                if user is None:
+                    continue
                 for i, vps in enumerate(vps_list):
-                    status_text = vps.get('status', 'unknown').upper()
-                    if vps.get('suspended', False):
-                        status_text += " (SUSPENDED)"
-                    all_vps.append(f"**{user.name}** - UnixNodes VPS {i+1}: `{vps['container_name']}` - {status_text}")
-            except:
-                pass
+                    status_text = status_label(vps.get('status', 'unknown'), vps['suspended'])
+                    yield f"**{user.name}** - UnixNodes VPS {i+1}: `{vps['container_name']}` - {status_text}"
 
-        # Create multiple embeds if needed to avoid character limit
-        for i in range(0, len(all_vps), 20):
-            chunk = all_vps[i:i+20]
-            embed = create_embed(f"🖥️ All UnixNodes VPS ({i+1}-{min(i+20, len(all_vps))})", f"List of all UnixNodes VPS deployments", 0x1a1a1a)
+        # Create multiple embeds if needed to avoid character limit, formatting one page at a time
+        for start, chunk in iter_chunks(iter_vps_lines(), 20):
+            embed = create_embed(f"🖥️ All UnixNodes VPS ({start+1}-{start+len(chunk)})", f"List of all UnixNodes VPS deployments", 0x1a1a1a)
             add_field(embed, "VPS List", "\n".join(chunk), False)
             await ctx.send(embed=embed)
     else:
         # Show specific VPS info
-        found_vps = None
-        found_user = None
-
-        for user_id, vps_list in vps_data.items():
-            for vps in vps_list:
-                if vps['container_name'] == container_name:
-                    found_vps = vps
-                    found_user = await bot.fetch_user(int(user_id))
-                    break
-            if found_vps:
-                break
-
-        if not found_vps:
+        entry = container_index.get(container_name)
+        if not entry:
             await ctx.send(embed=create_error_embed("VPS Not Found", f"No UnixNodes VPS found with container name: `{container_name}`"))
             return
+        user_id, found_vps = entry
+        found_user = await bot.fetch_user(int(user_id))
 
-        suspended_text = " (SUSPENDED)" if found_vps.get('suspended', False) else ""
+        suspended_text = " (SUSPENDED)" if found_vps['suspended'] else ""
         embed = create_embed(f"🖥️ UnixNodes VPS Information - {container_name}", f"Details for VPS owned by {found_user.mention}{suspended_text}", 0x1a1a1a)
         add_field(embed, "👤 Owner", f"**Name:** {found_user.name}\n**ID:** {found_user.id}", False)
-        add_field(embed, "📊 Specifications", f"**RAM:** {found_vps['ram']}\n**CPU:** {found_vps['cpu']} Cores\n**Storage:** {found_vps['storage']}", False)
-        add_field(embed, "📈 Status", f"**Current:** {found_vps.get('status', 'unknown').upper()}{suspended_text}\n**Suspended:** {found_vps.get('suspended', False)}\n**Created:** {found_vps.get('created_at', 'Unknown')}", False)
+        add_field(embed, "📊 Specifications", specs_str(found_vps), False)
+        add_field(embed, "📈 Status", f"**Current:** {found_vps.get('status', 'unknown').upper()}{suspended_text}\n**Suspended:** {found_vps['suspended']}\n**Created:** {found_vps.get('created_at', 'Unknown')}", False)
 
-        if 'config' in found_vps:
-            add_field(embed, "⚙️ Configuration", f"**Config:** {found_vps['config']}", False)
+        add_field(embed, "⚙️ Configuration", f"**Config:** {config_str(found_vps)}", False)
 
         if found_vps.get('shared_with'):
-            shared_users = []
-            for shared_id in found_vps['shared_with']:
-                try:
-                    shared_user = await bot.fetch_user(int(shared_id))
-                    shared_users.append(f"• {shared_user.mention}")
-                except:
-                    shared_users.append(f"• Unknown User ({shared_id})")
-            shared_text = "\n".join(shared_users)
+            shared_ids = list(found_vps['shared_with'])
+            shared_users = await asyncio.gather(*(get_user_cached(shared_id) for shared_id in shared_ids))
+            shared_text = "\n".join(
+                f"• {shared_user.mention}" if shared_user else f"• Unknown User ({shared_id})"
+                for shared_id, shared_user in zip(shared_ids, shared_users)
+            )
             add_field(embed, "🔗 Shared With", shared_text, False)
 
         await ctx.send(embed=embed)
@@ -1400,16 +1972,15 @@ async def restart_vps(ctx, container_name: str):
     await ctx.send(embed=create_info_embed("Restarting VPS", f"Restarting UnixNodes VPS `{container_name}`..."))
 
     try:
-        await execute_lxc(f"lxc restart {container_name}")
+        await execute_lxc("restart", container_name)
+        invalidate_container_stats(container_name)
 
         # Update status in database
-        for user_id, vps_list in vps_data.items():
-            for vps in vps_list:
-                if vps['container_name'] == container_name:
-                    vps['status'] = 'running'
-                    vps['suspended'] = False
-                    save_data()
-                    break
+        entry = container_index.get(container_name)
+        if entry:
+            user_id, vps = entry
+            update_vps(vps, status='running', suspended=False)
+            save_users(user_id)
 
         await ctx.send(embed=create_success_embed("VPS Restarted", f"UnixNodes VPS `{container_name}` has been restarted successfully!"))
 
@@ -1420,12 +1991,12 @@ async def restart_vps(ctx, container_name: str):
 @is_admin()
 async def backup_vps(ctx, container_name: str):
     """Create a snapshot of a UnixNodes VPS (Admin only)"""
-    snapshot_name = f"unixnodes-{container_name}-backup-{datetime.now().strftime('%Y%m%d-%H%M%S')}"
+    snapshot_name = f"unixnodes-{container_name}-backup-{_name_stamp()}"
 
     await ctx.send(embed=create_info_embed("Creating UnixNodes Backup", f"Creating snapshot of `{container_name}`..."))
 
     try:
-        await execute_lxc(f"lxc snapshot {container_name} {snapshot_name}")
+        await execute_lxc("snapshot", container_name, snapshot_name)
         await ctx.send(embed=create_success_embed("Backup Created", f"UnixNodes Snapshot `{snapshot_name}` created successfully!"))
 
     except Exception as e:
@@ -1438,7 +2009,7 @@ async def restore_vps(ctx, container_name: str, snapshot_name: str):
     await ctx.send(embed=create_info_embed("Restoring VPS", f"Restoring `{container_name}` from UnixNodes snapshot `{snapshot_name}`..."))
 
     try:
-        await execute_lxc(f"lxc restore {container_name} {snapshot_name}")
+        await execute_lxc("restore", container_name, snapshot_name)
         await ctx.send(embed=create_success_embed("VPS Restored", f"UnixNodes VPS `{container_name}` has been restored from snapshot!"))
 
     except Exception as e:
@@ -1449,25 +2020,15 @@ async def restore_vps(ctx, container_name: str, snapshot_name: str):
 async def list_snapshots(ctx, container_name: str):
     """List all snapshots for a UnixNodes VPS (Admin only)"""
     try:
-        # Improved parsing for lxc list --type snapshot
-        proc = await asyncio.create_subprocess_exec(
-            "lxc", "list", "--type", "snapshot", "--columns", "n",
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE
-        )
-        stdout, stderr = await proc.communicate()
-        if proc.returncode != 0:
-            raise Exception(stderr.decode())
-
-        snapshots = [line.strip() for line in stdout.decode().splitlines() if line.strip() and container_name in line]
-        snapshots = [snap.split()[0] for snap in snapshots if snap]  # Extract names
+        # LXD returns the snapshot URLs of just this instance, the name is the last path segment
+        urls = await lxd_query(instance_path(container_name, "/snapshots")) or []
+        snapshots = [urllib.parse.unquote(url.rsplit("/", 1)[-1]) for url in urls]
 
         if snapshots:
             # Create multiple embeds if needed to avoid character limit
-            for i in range(0, len(snapshots), 20):
-                chunk = snapshots[i:i+20]
-                embed = create_embed(f"📸 UnixNodes Snapshots for {container_name} ({i+1}-{min(i+20, len(snapshots))})", f"List of snapshots", 0x1a1a1a)
-                add_field(embed, "Snapshots", "\n".join([f"• {snap}" for snap in chunk]), False)
+            for start, chunk in iter_chunks(snapshots, 20):
+                embed = create_embed(f"📸 UnixNodes Snapshots for {container_name} ({start+1}-{start+len(chunk)})", f"List of snapshots", 0x1a1a1a)
+                add_field(embed, "Snapshots", "\n".join(f"• {snap}" for snap in chunk), False)
                 await ctx.send(embed=embed)
         else:
             await ctx.send(embed=create_info_embed("No Snapshots", f"No UnixNodes snapshots found for `{container_name}`"))
@@ -1482,15 +2043,7 @@ async def execute_command(ctx, container_name: str, *, command: str):
     await ctx.send(embed=create_info_embed("Executing Command", f"Running command in UnixNodes VPS `{container_name}`..."))
 
     try:
-        proc = await asyncio.create_subprocess_exec(
-            "lxc", "exec", container_name, "--", "bash", "-c", command,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE
-        )
-        stdout, stderr = await proc.communicate()
-
-        output = stdout.decode() if stdout else "No output"
-        error = stderr.decode() if stderr else ""
+        returncode, output, error = await run_capped("lxc", "exec", container_name, "--", "bash", "-c", command, timeout=None, kill_on_overflow=False)
 
         embed = create_embed(f"Command Output - {container_name}", f"Command: `{command}`", 0x1a1a1a)
 
@@ -1505,7 +2058,7 @@ async def execute_command(ctx, container_name: str, *, command: str):
                 error = error[:1000] + "\n... (truncated)"
             add_field(embed, "⚠️ Error", f"```\n{error}\n```", False)
 
-        add_field(embed, "🔄 Exit Code", f"**{proc.returncode}**", False)
+        add_field(embed, "🔄 Exit Code", f"**{returncode}**", False)
 
         await ctx.send(embed=embed)
 
@@ -1536,21 +2089,33 @@ async def stop_all_vps(ctx):
                 stdout, stderr = await proc.communicate()
 
                 if proc.returncode == 0:
-                    # Update all VPS status in database to stopped
-                    stopped_count = 0
-                    for user_id, vps_list in vps_data.items():
-                        for vps in vps_list:
-                            if vps.get('status') == 'running':
-                                vps['status'] = 'stopped'
-                                vps['suspended'] = False
-                                stopped_count += 1
+                    # Update all VPS status in database to stopped, remembering whose VPS went down
+                    stopped = {}
+                    for user_id, vps in container_index.values():
+                        if vps.get('status') == 'running':
+                            update_vps(vps, status='stopped', suspended=False)
+                            invalidate_container_stats(vps['container_name'])
+                            stopped.setdefault(user_id, []).append(vps['container_name'])
+                    stopped_count = sum(len(names) for names in stopped.values())
 
-                    save_data()
+                    save_users(*stopped)
 
                     embed = create_success_embed("All UnixNodes VPS Stopped", f"Successfully stopped {stopped_count} VPS using `lxc stop --all --force`")
                     output_text = stdout.decode() if stdout else 'No output'
                     add_field(embed, "Command Output", f"```\n{output_text}\n```", False)
                     await interaction.followup.send(embed=embed)
+
+                    # DM the owners concurrently instead of one API round-trip after another
+                    async def notify(user_id, names):
+                        owner = await get_user_cached(user_id)
+                        if owner:
+                            vps_text = ", ".join(f"`{name}`" for name in names)
+                            await owner.send(embed=create_warning_embed("UnixNodes VPS Stopped", f"Your VPS {vps_text} was stopped by a UnixNodes admin.\n\nUse `!manage` to start it again."))
+
+                    results = await asyncio.gather(*(notify(user_id, names) for user_id, names in stopped.items()), return_exceptions=True)
+                    for user_id, result in zip(stopped, results):
+                        if isinstance(result, Exception):
+                            logger.error(f"Failed to DM owner {user_id}: {result}")
                 else:
                     error_msg = stderr.decode() if stderr else "Unknown error"
                     embed = create_error_embed("Stop Failed", f"Failed to stop UnixNodes VPS: {error_msg}")
@@ -1596,31 +2161,21 @@ async def resize_vps(ctx, container_name: str, ram: int = None, cpu: int = None,
         return
     
     # Find the VPS in our database
-    found_vps = None
-    user_id = None
-    vps_index = None
-    
-    for uid, vps_list in vps_data.items():
-        for i, vps in enumerate(vps_list):
-            if vps['container_name'] == container_name:
-                found_vps = vps
-                user_id = uid
-                vps_index = i
-                break
-        if found_vps:
-            break
-    
-    if not found_vps:
+    entry = container_index.get(container_name)
+    if not entry:
         await ctx.send(embed=create_error_embed("VPS Not Found", f"No UnixNodes VPS found with container name: `{container_name}`"))
         return
+    # found_vps is the live record inside vps_data, updating it in place is all that's needed before saving
+    user_id, found_vps = entry
     
-    was_running = found_vps.get('status') == 'running' and not found_vps.get('suspended', False)
+    was_running = found_vps.get('status') == 'running' and not found_vps['suspended']
     if was_running:
         await ctx.send(embed=create_info_embed("Stopping VPS", f"Stopping UnixNodes VPS `{container_name}` to apply resource changes..."))
         try:
-            await execute_lxc(f"lxc stop {container_name}")
-            found_vps['status'] = 'stopped'
-            save_data()
+            await execute_lxc("stop", container_name)
+            invalidate_container_stats(container_name)
+            update_vps(found_vps, status='stopped')
+            save_users(user_id)
         except Exception as e:
             await ctx.send(embed=create_error_embed("Stop Failed", f"Error stopping VPS: {str(e)}"))
             return
@@ -1628,44 +2183,41 @@ async def resize_vps(ctx, container_name: str, ram: int = None, cpu: int = None,
     changes = []
     
     try:
-        new_ram = int(found_vps['ram'].replace('GB', ''))
-        new_cpu = int(found_vps['cpu'])
-        new_disk = int(found_vps['storage'].replace('GB', ''))
+        new_ram = found_vps['ram']
+        new_cpu = found_vps['cpu']
+        new_disk = found_vps['storage']
         
         # Resize RAM if specified
         if ram is not None and ram > 0:
             new_ram = ram
             ram_mb = ram * 1024
-            await execute_lxc(f"lxc config set {container_name} limits.memory {ram_mb}MB")
+            await execute_lxc("config", "set", container_name, "limits.memory", f"{ram_mb}MB")
             changes.append(f"RAM: {ram}GB")
         
         # Resize CPU if specified
         if cpu is not None and cpu > 0:
             new_cpu = cpu
-            await execute_lxc(f"lxc config set {container_name} limits.cpu {cpu}")
+            await execute_lxc("config", "set", container_name, "limits.cpu", str(cpu))
             changes.append(f"CPU: {cpu} cores")
         
         # Resize disk if specified
         if disk is not None and disk > 0:
             new_disk = disk
-            await execute_lxc(f"lxc config device set {container_name} root size {disk}GB")
+            await execute_lxc("config", "device", "set", container_name, "root", "size", f"{disk}GB")
             changes.append(f"Disk: {disk}GB")
         
         # Update VPS data
-        found_vps['ram'] = f"{new_ram}GB"
-        found_vps['cpu'] = str(new_cpu)
-        found_vps['storage'] = f"{new_disk}GB"
-        found_vps['config'] = f"{new_ram}GB RAM / {new_cpu} CPU / {new_disk}GB Disk"
+        update_vps(found_vps, ram=new_ram, cpu=new_cpu, storage=new_disk)
         
         # Save changes to database
-        vps_data[user_id][vps_index] = found_vps
-        save_data()
+        save_users(user_id)
         
         # Start the VPS if it was running before
         if was_running:
-            await execute_lxc(f"lxc start {container_name}")
-            found_vps['status'] = 'running'
-            save_data()
+            await execute_lxc("start", container_name)
+            invalidate_container_stats(container_name)
+            update_vps(found_vps, status='running')
+            save_users(user_id)
         
         embed = create_success_embed("VPS Resized", f"Successfully resized resources for UnixNodes VPS `{container_name}`")
         add_field(embed, "Changes Applied", "\n".join(changes), False)
@@ -1680,52 +2232,44 @@ async def clone_vps(ctx, container_name: str, new_name: str = None):
     """Clone a UnixNodes VPS (Admin only)"""
     if not new_name:
         # Generate a new name if not provided
-        timestamp = datetime.now().strftime('%Y%m%d-%H%M%S')
-        new_name = f"unixnodes-{container_name}-clone-{timestamp}"
+        new_name = f"unixnodes-{container_name}-clone-{_name_stamp()}"
     
     await ctx.send(embed=create_info_embed("Cloning VPS", f"Cloning UnixNodes VPS `{container_name}` to `{new_name}`..."))
     
     try:
         # Find the original VPS in our database
-        found_vps = None
-        user_id = None
-        
-        for uid, vps_list in vps_data.items():
-            for vps in vps_list:
-                if vps['container_name'] == container_name:
-                    found_vps = vps
-                    user_id = uid
-                    break
-            if found_vps:
-                break
-        
-        if not found_vps:
+        entry = container_index.get(container_name)
+        if not entry:
             await ctx.send(embed=create_error_embed("VPS Not Found", f"No UnixNodes VPS found with container name: `{container_name}`"))
             return
+        user_id, found_vps = entry
         
         # Clone the container
-        await execute_lxc(f"lxc copy {container_name} {new_name}")
+        await execute_lxc("copy", container_name, new_name)
         
         # Start the new container
-        await execute_lxc(f"lxc start {new_name}")
+        await execute_lxc("start", new_name)
         
         # Create a new VPS entry in the database
         if user_id not in vps_data:
             vps_data[user_id] = []
         
+        # A real copy here, the clone is a separate record; the mutable fields are replaced below
         new_vps = found_vps.copy()
         new_vps['container_name'] = new_name
         new_vps['status'] = 'running'
         new_vps['suspended'] = False
         new_vps['suspension_history'] = []
         new_vps['created_at'] = datetime.now().isoformat()
-        new_vps['shared_with'] = []
+        new_vps['shared_with'] = set()
         
         vps_data[user_id].append(new_vps)
-        save_data()
+        container_index[new_name] = (user_id, new_vps)
+        _account(new_vps, 1)
+        save_users(user_id)
         
         embed = create_success_embed("VPS Cloned", f"Successfully cloned UnixNodes VPS `{container_name}` to `{new_name}`")
-        add_field(embed, "New VPS Details", f"**RAM:** {new_vps['ram']}\n**CPU:** {new_vps['cpu']} Cores\n**Storage:** {new_vps['storage']}", False)
+        add_field(embed, "New VPS Details", specs_str(new_vps), False)
         await ctx.send(embed=embed)
         
     except Exception as e:
@@ -1738,32 +2282,33 @@ async def migrate_vps(ctx, container_name: str, target_pool: str):
     await ctx.send(embed=create_info_embed("Migrating VPS", f"Migrating UnixNodes VPS `{container_name}` to storage pool `{target_pool}`..."))
     
     try:
-        # Stop the container first
-        await execute_lxc(f"lxc stop {container_name}")
-        
-        # Create a temporary name for migration
-        temp_name = f"unixnodes-{container_name}-temp-{int(time.time())}"
-        
-        # Copy to new pool with temp name
-        await execute_lxc(f"lxc copy {container_name} {temp_name} --storage {target_pool}")
-        
-        # Delete the old container
-        await execute_lxc(f"lxc delete {container_name} --force")
-        
-        # Rename temp to original name
-        await execute_lxc(f"lxc rename {temp_name} {container_name}")
-        
-        # Start the container again
-        await execute_lxc(f"lxc start {container_name}")
-        
-        # Update status in database
-        for user_id, vps_list in vps_data.items():
-            for vps in vps_list:
-                if vps['container_name'] == container_name:
-                    vps['status'] = 'running'
-                    vps['suspended'] = False
-                    save_data()
-                    break
+        # Pool moves need a stopped container, only stop (and later restart) it if it is running;
+        # read the live state rather than a cached stats entry, and don't guess when LXD can't answer
+        invalidate_container_stats(container_name)
+        status = await get_container_status(container_name)
+        if status == "Unknown":
+            await ctx.send(embed=create_error_embed("Migration Failed", f"Could not read the state of UnixNodes VPS `{container_name}`, nothing was changed."))
+            return
+        was_running = status == "RUNNING"
+        if was_running:
+            await execute_lxc("stop", container_name)
+
+        try:
+            # LXD moves the instance between pools itself, no copy/delete/rename round-trips
+            await execute_lxc("move", container_name, "--storage", target_pool)
+        except Exception as e:
+            # copy + delete --force would destroy a container that is still running, only fall back once it is confirmed stopped
+            if await get_container_status(container_name) != "STOPPED":
+                raise
+            logger.warning(f"In-place move of {container_name} failed, copying instead: {e}")
+            temp_name = f"unixnodes-{container_name}-temp-{int(time.time())}"
+            await execute_lxc("copy", container_name, temp_name, "--storage", target_pool)
+            await execute_lxc("delete", container_name, "--force")
+            await execute_lxc("rename", temp_name, container_name)
+
+        if was_running:
+            await execute_lxc("start", container_name)
+        invalidate_container_stats(container_name)
         
         await ctx.send(embed=create_success_embed("VPS Migrated", f"Successfully migrated UnixNodes VPS `{container_name}` to storage pool `{target_pool}`"))
         
@@ -1777,10 +2322,11 @@ async def vps_stats(ctx, container_name: str):
     await ctx.send(embed=create_info_embed("Gathering Statistics", f"Collecting statistics for UnixNodes VPS `{container_name}`..."))
     
     try:
-        status = await get_container_status(container_name)
-        cpu_usage = await get_container_cpu(container_name)
-        memory_usage = await get_container_memory(container_name)
-        disk_usage = await get_container_disk(container_name)
+        stats = await get_container_stats_bulk(container_name)
+        status = stats['status']
+        cpu_usage = f"{stats['cpu']:.1f}%"
+        memory_usage = stats['memory']
+        disk_usage = stats['disk']
         network_usage = "N/A"  # Simplified for now
         
         # Create embed with statistics
@@ -1792,19 +2338,12 @@ async def vps_stats(ctx, container_name: str):
         add_field(embed, "🌐 Network Usage", f"**{network_usage}**", False)
         
         # Find the VPS in our database
-        found_vps = None
-        for vps_list in vps_data.values():
-            for vps in vps_list:
-                if vps['container_name'] == container_name:
-                    found_vps = vps
-                    break
-            if found_vps:
-                break
-        
-        if found_vps:
-            suspended_text = " (SUSPENDED)" if found_vps.get('suspended', False) else ""
+        entry = container_index.get(container_name)
+        if entry:
+            found_vps = entry[1]
+            suspended_text = " (SUSPENDED)" if found_vps['suspended'] else ""
             add_field(embed, "📋 Allocated Resources", 
-                           f"**RAM:** {found_vps['ram']}\n**CPU:** {found_vps['cpu']} Cores\n**Storage:** {found_vps['storage']}\n**Status:** {found_vps.get('status', 'unknown').upper()}{suspended_text}", 
+                           f"{specs_str(found_vps)}\n**Status:** {found_vps.get('status', 'unknown').upper()}{suspended_text}", 
                            False)
         
         await ctx.send(embed=embed)
@@ -1823,15 +2362,9 @@ async def vps_network(ctx, container_name: str, action: str, value: str = None):
     try:
         if action.lower() == "list":
             # List network interfaces
-            proc = await asyncio.create_subprocess_exec(
-                "lxc", "exec", container_name, "--", "ip", "addr",
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE
-            )
-            stdout, stderr = await proc.communicate()
+            returncode, output, error = await run_capped("lxc", "exec", container_name, "--", "ip", "addr")
             
-            if proc.returncode == 0:
-                output = stdout.decode()
+            if returncode in (0, None):
                 # Split output if too long
                 if len(output) > 1000:
                     output = output[:1000] + "\n... (truncated)"
@@ -1840,12 +2373,12 @@ async def vps_network(ctx, container_name: str, action: str, value: str = None):
                 add_field(embed, "Interfaces", f"```\n{output}\n```", False)
                 await ctx.send(embed=embed)
             else:
-                await ctx.send(embed=create_error_embed("Error", f"Failed to list network interfaces: {stderr.decode()}"))
+                await ctx.send(embed=create_error_embed("Error", f"Failed to list network interfaces: {error}"))
         
         elif action.lower() == "limit" and value:
             # Set network limit
-            await execute_lxc(f"lxc config device set {container_name} eth0 limits.egress {value}")
-            await execute_lxc(f"lxc config device set {container_name} eth0 limits.ingress {value}")
+            await execute_lxc("config", "device", "set", container_name, "eth0", "limits.egress", value)
+            await execute_lxc("config", "device", "set", container_name, "eth0", "limits.ingress", value)
             await ctx.send(embed=create_success_embed("Network Limited", f"Set UnixNodes network limit to {value} for `{container_name}`"))
         
         elif action.lower() in ["add", "remove"]:
@@ -1864,15 +2397,9 @@ async def vps_processes(ctx, container_name: str):
     await ctx.send(embed=create_info_embed("Gathering Processes", f"Listing processes in UnixNodes VPS `{container_name}`..."))
     
     try:
-        proc = await asyncio.create_subprocess_exec(
-            "lxc", "exec", container_name, "--", "ps", "aux",
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE
-        )
-        stdout, stderr = await proc.communicate()
+        returncode, output, error = await run_capped("lxc", "exec", container_name, "--", "ps", "aux")
         
-        if proc.returncode == 0:
-            output = stdout.decode()
+        if returncode in (0, None):
             # Split output if too long
             if len(output) > 1000:
                 output = output[:1000] + "\n... (truncated)"
@@ -1881,7 +2408,7 @@ async def vps_processes(ctx, container_name: str):
             add_field(embed, "Process List", f"```\n{output}\n```", False)
             await ctx.send(embed=embed)
         else:
-            await ctx.send(embed=create_error_embed("Error", f"Failed to list processes: {stderr.decode()}"))
+            await ctx.send(embed=create_error_embed("Error", f"Failed to list processes: {error}"))
     
     except Exception as e:
         await ctx.send(embed=create_error_embed("Process Listing Failed", f"Error: {str(e)}"))
@@ -1893,15 +2420,9 @@ async def vps_logs(ctx, container_name: str, lines: int = 50):
     await ctx.send(embed=create_info_embed("Gathering Logs", f"Fetching last {lines} lines from UnixNodes VPS `{container_name}`..."))
     
     try:
-        proc = await asyncio.create_subprocess_exec(
-            "lxc", "exec", container_name, "--", "journalctl", "-n", str(lines),
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE
-        )
-        stdout, stderr = await proc.communicate()
+        returncode, output, error = await run_capped("lxc", "exec", container_name, "--", "journalctl", "-n", str(lines))
         
-        if proc.returncode == 0:
-            output = stdout.decode()
+        if returncode in (0, None):
             # Split output if too long
             if len(output) > 1000:
                 output = output[:1000] + "\n... (truncated)"
@@ -1910,7 +2431,7 @@ async def vps_logs(ctx, container_name: str, lines: int = 50):
             add_field(embed, "System Logs", f"```\n{output}\n```", False)
             await ctx.send(embed=embed)
         else:
-            await ctx.send(embed=create_error_embed("Error", f"Failed to fetch logs: {stderr.decode()}"))
+            await ctx.send(embed=create_error_embed("Error", f"Failed to fetch logs: {error}"))
     
     except Exception as e:
         await ctx.send(embed=create_error_embed("Log Retrieval Failed", f"Error: {str(e)}"))
@@ -1919,68 +2440,98 @@ async def vps_logs(ctx, container_name: str, lines: int = 50):
 @is_admin()
 async def suspend_vps(ctx, container_name: str, *, reason: str = "Admin action"):
     """Suspend a UnixNodes VPS (Admin only)"""
-    found = False
-    for uid, lst in vps_data.items():
-        for vps in lst:
-            if vps['container_name'] == container_name:
-                if vps.get('status') != 'running':
-                    await ctx.send(embed=create_error_embed("Cannot Suspend", "UnixNodes VPS must be running to suspend."))
-                    return
-                try:
-                    await execute_lxc(f"lxc stop {container_name}")
-                    vps['status'] = 'suspended'
-                    vps['suspended'] = True
-                    if 'suspension_history' not in vps:
-                        vps['suspension_history'] = []
-                    vps['suspension_history'].append({
-                        'time': datetime.now().isoformat(),
-                        'reason': reason,
-                        'by': f"{ctx.author.name} ({ctx.author.id})"
-                    })
-                    save_data()
-                except Exception as e:
-                    await ctx.send(embed=create_error_embed("Suspend Failed", str(e)))
-                    return
-                # DM owner
-                try:
-                    owner = await bot.fetch_user(int(uid))
-                    embed = create_warning_embed("🚨 UnixNodes VPS Suspended", f"Your VPS `{container_name}` has been suspended by an admin.\n\n**Reason:** {reason}\n\nContact a UnixNodes admin to unsuspend.")
-                    await owner.send(embed=embed)
-                except Exception as dm_e:
-                    logger.error(f"Failed to DM owner {uid}: {dm_e}")
-                await ctx.send(embed=create_success_embed("VPS Suspended", f"UnixNodes VPS `{container_name}` suspended. Reason: {reason}"))
-                found = True
-                break
-        if found:
-            break
-    if not found:
+    entry = container_index.get(container_name)
+    if not entry:
         await ctx.send(embed=create_error_embed("Not Found", f"UnixNodes VPS `{container_name}` not found."))
+        return
+    uid, vps = entry
+    if vps.get('status') != 'running':
+        await ctx.send(embed=create_error_embed("Cannot Suspend", "UnixNodes VPS must be running to suspend."))
+        return
+    try:
+        await execute_lxc("stop", container_name)
+        invalidate_container_stats(container_name)
+        update_vps(vps, status='suspended', suspended=True)
+        record_suspension(vps, reason, f"{ctx.author.name} ({ctx.author.id})")
+        save_users(uid)
+    except Exception as e:
+        await ctx.send(embed=create_error_embed("Suspend Failed", str(e)))
+        return
+    # DM owner
+    try:
+        owner = await get_user_cached(uid)
+        if owner:
+            embed = create_warning_embed("🚨 UnixNodes VPS Suspended", f"Your VPS `{container_name}` has been suspended by an admin.\n\n**Reason:** {reason}\n\nContact a UnixNodes admin to unsuspend.")
+            await owner.send(embed=embed)
+    except Exception as dm_e:
+        logger.error(f"Failed to DM owner {uid}: {dm_e}")
+    await ctx.send(embed=create_success_embed("VPS Suspended", f"UnixNodes VPS `{container_name}` suspended. Reason: {reason}"))
 
 @bot.command(name='unsuspend-vps')
 @is_admin()
 async def unsuspend_vps(ctx, container_name: str):
     """Unsuspend a UnixNodes VPS (Admin only)"""
-    found = False
-    for uid, lst in vps_data.items():
-        for vps in lst:
-            if vps['container_name'] == container_name:
-                if not vps.get('suspended', False):
-                    await ctx.send(embed=create_error_embed("Not Suspended", "UnixNodes VPS is not suspended."))
-                    return
-                try:
-                    vps['suspended'] = False
-                    vps['status'] = 'running'
-                    await execute_lxc(f"lxc start {container_name}")
-                    save_data()
-                    await ctx.send(embed=create_success_embed("VPS Unsuspended", f"UnixNodes VPS `{container_name}` unsuspended and started."))
-                    found = True
-                except Exception as e:
-                    await ctx.send(embed=create_error_embed("Start Failed", str(e)))
-                break
-        if found:
-            break
-    if not found:
+    entry = container_index.get(container_name)
+    if not entry:
         await ctx.send(embed=create_error_embed("Not Found", f"UnixNodes VPS `{container_name}` not found."))
+        return
+    uid, vps = entry
+    if not vps['suspended']:
+        await ctx.send(embed=create_error_embed("Not Suspended", "UnixNodes VPS is not suspended."))
+        return
+    try:
+        await execute_lxc("start", container_name)
+        invalidate_container_stats(container_name)
+        update_vps(vps, suspended=False, status='running')
+        save_users(uid)
+        await ctx.send(embed=create_success_embed("VPS Unsuspended", f"UnixNodes VPS `{container_name}` unsuspended and started."))
+    except Exception as e:
+        await ctx.send(embed=create_error_embed("Start Failed", str(e)))
+
+SUSPENSION_LOG_LINE = "**{t}** - VPS `{name}` (Owner: <@{uid}>) - {reason} (by {by})"
+
+class SuspensionLogView(discord.ui.View):
+    """Prev/Next pager over (time, owner id, container, event) tuples sorted newest first"""
+    PAGE_SIZE = 10
+
+    def __init__(self, author_id, events):
+        super().__init__(timeout=300)
+        self.author_id = author_id
+        self.events = events
+        self.page = 0
+        self.page_count = (len(events) + self.PAGE_SIZE - 1) // self.PAGE_SIZE
+        self.update_buttons()
+
+    def build_embed(self):
+        start = self.page * self.PAGE_SIZE
+        chunk = self.events[start:start + self.PAGE_SIZE]
+        lines = [
+            SUSPENSION_LOG_LINE.format(t=format_iso_time(time_str, '%Y-%m-%d %H:%M'), name=name, uid=uid, reason=event['reason'], by=event['by'])
+            for time_str, uid, name, event in chunk
+        ]
+        embed = create_embed(f"UnixNodes Suspension Logs ({start+1}-{start+len(chunk)} of {len(self.events)})", f"Global suspension events (newest first)")
+        add_field(embed, "Events", "\n".join(lines), False)
+        return embed
+
+    def update_buttons(self):
+        self.previous.disabled = self.page == 0
+        self.next.disabled = self.page >= self.page_count - 1
+
+    async def turn(self, interaction, delta):
+        if interaction.user.id != self.author_id:
+            await interaction.response.send_message(embed=create_error_embed("Access Denied", "Run `!suspension-logs` yourself to browse the logs."), ephemeral=True)
+            return
+        self.page = min(max(self.page + delta, 0), self.page_count - 1)
+        self.update_buttons()
+        await interaction.response.edit_message(embed=self.build_embed(), view=self)
+
+    @discord.ui.button(label="◀ Previous", style=discord.ButtonStyle.secondary)
+    async def previous(self, interaction: discord.Interaction, item: discord.ui.Button):
+        await self.turn(interaction, -1)
+
+    @discord.ui.button(label="Next ▶", style=discord.ButtonStyle.secondary)
+    async def next(self, interaction: discord.Interaction, item: discord.ui.Button):
+        await self.turn(interaction, 1)
 
 @bot.command(name='suspension-logs')
 @is_admin()
@@ -1988,124 +2539,107 @@ async def suspension_logs(ctx, container_name: str = None):
     """View UnixNodes suspension logs (Admin only)"""
     if container_name:
         # Specific VPS
-        found = None
-        for lst in vps_data.values():
-            for vps in lst:
-                if vps['container_name'] == container_name:
-                    found = vps
-                    break
-            if found:
-                break
-        if not found:
+        entry = container_index.get(container_name)
+        if not entry:
             await ctx.send(embed=create_error_embed("Not Found", f"UnixNodes VPS `{container_name}` not found."))
             return
-        history = found.get('suspension_history', [])
+        history = entry[1]['suspension_history']
         if not history:
             await ctx.send(embed=create_info_embed("No Suspensions", f"No UnixNodes suspension history for `{container_name}`."))
             return
         embed = create_embed("UnixNodes Suspension History", f"For `{container_name}`")
         text = []
-        for h in sorted(history, key=lambda x: x['time'], reverse=True)[:10]:  # Last 10
-            t = datetime.fromisoformat(h['time']).strftime('%Y-%m-%d %H:%M:%S')
+        for h in reversed(history[-10:]):  # Last 10, history is kept oldest-first
+            t = format_iso_time(h['time'], '%Y-%m-%d %H:%M:%S')
             text.append(f"**{t}** - {h['reason']} (by {h['by']})")
         add_field(embed, "History", "\n".join(text), False)
         if len(history) > 10:
             add_field(embed, "Note", "Showing last 10 entries.")
         await ctx.send(embed=embed)
     else:
-        # All logs
-        all_logs = []
-        for uid, lst in vps_data.items():
-            for vps in lst:
-                h = vps.get('suspension_history', [])
-                for event in sorted(h, key=lambda x: x['time'], reverse=True):
-                    t = datetime.fromisoformat(event['time']).strftime('%Y-%m-%d %H:%M')
-                    all_logs.append(f"**{t}** - VPS `{vps['container_name']}` (Owner: <@{uid}>) - {event['reason']} (by {event['by']})")
-        if not all_logs:
+        # All logs, sorted once across every VPS (ISO timestamps sort chronologically)
+        events = [
+            (event['time'], uid, vps['container_name'], event)
+            for uid, vps in container_index.values()
+            for event in vps['suspension_history']
+        ]
+        if not events:
             await ctx.send(embed=create_info_embed("No Suspensions", "No UnixNodes suspension events recorded."))
             return
-        # Split into embeds
-        for i in range(0, len(all_logs), 10):
-            chunk = all_logs[i:i+10]
-            embed = create_embed(f"UnixNodes Suspension Logs ({i+1}-{min(i+10, len(all_logs))})", f"Global suspension events (newest first)")
-            add_field(embed, "Events", "\n".join(chunk), False)
-            await ctx.send(embed=embed)
-
-@bot.command(name='help')
-async def show_help(ctx):
-    """Show UnixNodes help information"""
-    user_id = str(ctx.author.id)
-    is_user_admin = user_id == str(MAIN_ADMIN_ID) or user_id in admin_data.get("admins", [])
-    is_user_main_admin = user_id == str(MAIN_ADMIN_ID)
-
-    # Create multiple embeds for help to avoid character limit
-    # First embed with user commands
-    embed = create_embed("📚 UnixNodes Command Help - User Commands", "UnixNodes VPS Manager Commands:", 0x1a1a1a)
-
-    user_commands = [
-        ("!ping", "Check UnixNodes bot latency"),
-        ("!uptime", "Show host uptime"),
-        ("!myvps", "List your UnixNodes VPS"),
-        ("!manage [@user]", "Manage your VPS or another user's VPS (Admin only)"),
-        ("!share-user @user <vps_number>", "Share UnixNodes VPS access"),
-        ("!share-ruser @user <vps_number>", "Revoke UnixNodes VPS access"),
-        ("!manage-shared @owner <vps_number>", "Manage shared UnixNodes VPS")
-    ]
-
-    user_commands_text = "\n".join([f"**{cmd}** - {desc}" for cmd, desc in user_commands])
-    add_field(embed, "👤 User Commands", user_commands_text, False)
-    await ctx.send(embed=embed)
+        events.sort(key=operator.itemgetter(0), reverse=True)
+        # One page at a time, further pages are only formatted when someone flips to them
+        view = SuspensionLogView(ctx.author.id, events)
+        if view.page_count > 1:
+            await ctx.send(embed=view.build_embed(), view=view)
+        else:
+            await ctx.send(embed=view.build_embed())
+
+# Help text is static, the embeds are built once and only get a fresh footer per send
+HELP_USER_COMMANDS = (
+    ("!ping", "Check UnixNodes bot latency"),
+    ("!uptime", "Show host uptime"),
+    ("!myvps", "List your UnixNodes VPS"),
+    ("!manage [@user]", "Manage your VPS or another user's VPS (Admin only)"),
+    ("!share-user @user <vps_number>", "Share UnixNodes VPS access"),
+    ("!share-ruser @user <vps_number>", "Revoke UnixNodes VPS access"),
+    ("!manage-shared @owner <vps_number>", "Manage shared UnixNodes VPS")
+)
 
-    if is_user_admin:
-        # Second embed with admin commands
-        embed = create_embed("📚 UnixNodes Command Help - Admin Commands", "UnixNodes VPS Manager Commands:", 0x1a1a1a)
-
-        admin_commands = [
-            ("!lxc-list", "List all LXC containers"),
-            ("!create <ram_gb> <cpu_cores> <disk_gb> @user", "Create custom UnixNodes VPS"),
-            ("!delete-vps @user <vps_number> <reason>", "Delete user's UnixNodes VPS"),
-            ("!add-resources <vps_id> [ram] [cpu] [disk]", "Add resources to a UnixNodes VPS"),
-            ("!resize-vps <container> [ram] [cpu] [disk]", "Resize UnixNodes VPS resources"),
-            ("!suspend-vps <container> [reason]", "Suspend a UnixNodes VPS"),
-            ("!unsuspend-vps <container>", "Unsuspend a UnixNodes VPS"),
-            ("!suspension-logs [container]", "View UnixNodes suspension logs"),
-            ("!userinfo @user", "Get detailed UnixNodes user information"),
-            ("!serverstats", "Show UnixNodes server statistics"),
-            ("!vpsinfo [container]", "Get UnixNodes VPS information"),
-            ("!list-all", "View all UnixNodes VPS and user information"),
-            ("!restart-vps <container>", "Restart a UnixNodes VPS"),
-            ("!backup-vps <container>", "Create UnixNodes VPS snapshot"),
-            ("!restore-vps <container> <snapshot>", "Restore from UnixNodes snapshot"),
-            ("!list-snapshots <container>", "List UnixNodes VPS snapshots"),
-            ("!exec <container> <command>", "Execute command in UnixNodes VPS"),
-            ("!stop-vps-all", "Stop all UnixNodes VPS with lxc stop --all --force"),
-            ("!cpu-monitor <status|enable|disable>", "Control UnixNodes CPU monitoring system"),
-            ("!clone-vps <container> [new_name]", "Clone a UnixNodes VPS"),
-            ("!migrate-vps <container> <pool>", "Migrate UnixNodes VPS to storage pool"),
-            ("!vps-stats <container>", "Show UnixNodes VPS resource stats"),
-            ("!vps-network <container> <action> [value]", "Manage UnixNodes network"),
-            ("!vps-processes <container>", "List UnixNodes processes"),
-            ("!vps-logs <container> [lines]", "Show UnixNodes system logs")
-        ]
+HELP_ADMIN_COMMANDS = (
+    ("!lxc-list", "List all LXC containers"),
+    ("!create <ram_gb> <cpu_cores> <disk_gb> @user", "Create custom UnixNodes VPS"),
+    ("!delete-vps @user <vps_number> <reason>", "Delete user's UnixNodes VPS"),
+    ("!add-resources <vps_id> [ram] [cpu] [disk]", "Add resources to a UnixNodes VPS"),
+    ("!resize-vps <container> [ram] [cpu] [disk]", "Resize UnixNodes VPS resources"),
+    ("!suspend-vps <container> [reason]", "Suspend a UnixNodes VPS"),
+    ("!unsuspend-vps <container>", "Unsuspend a UnixNodes VPS"),
+    ("!suspension-logs [container]", "View UnixNodes suspension logs"),
+    ("!userinfo @user", "Get detailed UnixNodes user information"),
+    ("!serverstats", "Show UnixNodes server statistics"),
+    ("!vpsinfo [container]", "Get UnixNodes VPS information"),
+    ("!list-all", "View all UnixNodes VPS and user information"),
+    ("!restart-vps <container>", "Restart a UnixNodes VPS"),
+    ("!backup-vps <container>", "Create UnixNodes VPS snapshot"),
+    ("!restore-vps <container> <snapshot>", "Restore from UnixNodes snapshot"),
+    ("!list-snapshots <container>", "List UnixNodes VPS snapshots"),
+    ("!exec <container> <command>", "Execute command in UnixNodes VPS"),
+    ("!stop-vps-all", "Stop all UnixNodes VPS with lxc stop --all --force"),
+    ("!cpu-monitor <status|enable|disable>", "Control UnixNodes CPU monitoring system"),
+    ("!clone-vps <container> [new_name]", "Clone a UnixNodes VPS"),
+    ("!migrate-vps <container> <pool>", "Migrate UnixNodes VPS to storage pool"),
+    ("!vps-stats <container>", "Show UnixNodes VPS resource stats"),
+    ("!vps-network <container> <action> [value]", "Manage UnixNodes network"),
+    ("!vps-processes <container>", "List UnixNodes processes"),
+    ("!vps-logs <container> [lines]", "Show UnixNodes system logs")
+)
 
-        admin_commands_text = "\n".join([f"**{cmd}** - {desc}" for cmd, desc in admin_commands])
-        add_field(embed, "🛡️ Admin Commands", admin_commands_text, False)
-        await ctx.send(embed=embed)
+HELP_MAIN_ADMIN_COMMANDS = (
+    ("!admin-add @user", "Promote to UnixNodes admin"),
+    ("!admin-remove @user", "Remove UnixNodes admin"),
+    ("!admin-list", "View all UnixNodes admins")
+)
 
-    if is_user_main_admin:
-        # Third embed with main admin commands
-        embed = create_embed("📚 UnixNodes Command Help - Main Admin Commands", "UnixNodes VPS Manager Commands:", 0x1a1a1a)
+def _help_embed(title, field_name, help_commands):
+    """Build one help embed listing (command, description) pairs"""
+    embed = create_embed(title, "UnixNodes VPS Manager Commands:", 0x1a1a1a)
+    add_field(embed, field_name, "\n".join(f"**{cmd}** - {desc}" for cmd, desc in help_commands), False)
+    return embed
 
-        main_admin_commands = [
-            ("!admin-add @user", "Promote to UnixNodes admin"),
-            ("!admin-remove @user", "Remove UnixNodes admin"),
-            ("!admin-list", "View all UnixNodes admins")
-        ]
+HELP_USER_EMBED = _help_embed("📚 UnixNodes Command Help - User Commands", "👤 User Commands", HELP_USER_COMMANDS)
+HELP_ADMIN_EMBED = _help_embed("📚 UnixNodes Command Help - Admin Commands", "🛡️ Admin Commands", HELP_ADMIN_COMMANDS)
+HELP_MAIN_ADMIN_EMBED = _help_embed("📚 UnixNodes Command Help - Main Admin Commands", "👑 Main Admin Commands", HELP_MAIN_ADMIN_COMMANDS)
+HELP_MAIN_ADMIN_EMBED.set_footer(text="UnixNodes VPS Manager • Auto-suspend on high usage • Enhanced monitoring")
 
-        main_admin_commands_text = "\n".join([f"**{cmd}** - {desc}" for cmd, desc in main_admin_commands])
-        add_field(embed, "👑 Main Admin Commands", main_admin_commands_text, False)
-        embed.set_footer(text="UnixNodes VPS Manager • Auto-suspend on high usage • Enhanced monitoring")
-        await ctx.send(embed=embed)
+@bot.command(name='help')
+async def show_help(ctx):
+    """Show UnixNodes help information"""
+    # Separate embeds per audience keep each under the field limit, all go out in one message
+    embeds = [set_footer(HELP_USER_EMBED)]
+    if user_is_admin(ctx.author.id):
+        embeds.append(set_footer(HELP_ADMIN_EMBED))
+    if ctx.author.id == MAIN_ADMIN_ID:
+        embeds.append(HELP_MAIN_ADMIN_EMBED)
+    await ctx.send(embeds=embeds)
 
 # Command aliases for typos
 @bot.command(name='mangage')
@@ -2114,24 +2648,64 @@ async def manage_typo(ctx):
     await ctx.send(embed=create_info_embed("Command Correction", "Did you mean `!manage`? Use the correct UnixNodes command."))
 
 @bot.command(name='stats')
+@is_admin()
 async def stats_alias(ctx):
     """Alias for serverstats command"""
-    if str(ctx.author.id) == str(MAIN_ADMIN_ID) or str(ctx.author.id) in admin_data.get("admins", []):
-        await server_stats(ctx)
-    else:
-        await ctx.send(embed=create_error_embed("Access Denied", "This UnixNodes command requires admin privileges."))
+    await server_stats(ctx)
 
 @bot.command(name='info')
+@is_admin()
 async def info_alias(ctx):
     """Alias for userinfo command"""
-    if str(ctx.author.id) == str(MAIN_ADMIN_ID) or str(ctx.author.id) in admin_data.get("admins", []):
-        await ctx.send(embed=create_error_embed("Usage", "Please specify a user: `!info @user`"))
-    else:
-        await ctx.send(embed=create_error_embed("Access Denied", "This UnixNodes command requires admin privileges."))
+    await ctx.send(embed=create_error_embed("Usage", "Please specify a user: `!info @user`"))
+
+def install_event_loop_policy():
+    """Run the bot on uvloop when it is installed, returns True if it is in use"""
+    if uvloop is None or sys.platform == 'win32':
+        return False
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    logger.info("Using uvloop event loop")
+    return True
+
+def install_child_watcher():
+    """Reap lxc subprocesses through pidfds instead of SIGCHLD-driven waitpid polling"""
+    # Python 3.12+ already picks the pidfd watcher by default and deprecates setting one
+    if sys.platform != 'linux' or sys.version_info >= (3, 12) or not hasattr(asyncio, 'PidfdChildWatcher'):
+        return
+    try:
+        # pidfd_open needs Linux 5.3+
+        os.close(os.pidfd_open(os.getpid()))
+    except (AttributeError, OSError):
+        return
+    asyncio.set_child_watcher(asyncio.PidfdChildWatcher())
+    logger.info("Using pidfd child watcher for subprocesses")
+
+async def main():
+    """Log in to Discord while the data files load, then connect"""
+    global _save_event
+    _save_event = asyncio.Event()
+    if _snapshot_pending or _dirty_users or _admins_dirty:
+        _save_event.set()
+    if sys.platform != 'win32':
+        # SIGTERM would otherwise kill the process without running atexit, losing queued saves
+        loop = asyncio.get_running_loop()
+        closing = []
+        loop.add_signal_handler(signal.SIGTERM, lambda: closing.append(loop.create_task(bot.close())))
+    async with bot:
+        await asyncio.gather(bot.login(DISCORD_TOKEN), load_data())
+        await bot.connect()
+    await flush_pending()
 
 # Run the bot with your token
 if __name__ == "__main__":
+    # uvloop reaps subprocesses itself and has no child watchers
+    if not install_event_loop_policy():
+        install_child_watcher()
+    atexit.register(flush_now)
     if DISCORD_TOKEN:
-        bot.run(DISCORD_TOKEN)
+        try:
+            asyncio.run(main())
+        except KeyboardInterrupt:
+            pass
     else:
         logger.error("No Discord token found in DISCORD_TOKEN environment variable.")
\ No newline at end of file